@@ -0,0 +1,166 @@
+"""
+Arrow XCom Backend
+Passes pandas DataFrames between tasks as Arrow IPC files instead of
+staging CSV/Parquet files by hand.
+
+Enable with:
+    AIRFLOW__CORE__XCOM_BACKEND=arrow_xcom.ArrowXComBackend
+
+Files are deleted when their XCom row is cleared (task retry or clear);
+sweep_expired_files removes the rest after ARROW_XCOM_RETENTION_DAYS.
+"""
+
+import os
+import time
+import uuid
+import logging
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+from airflow.models.xcom import BaseXCom
+
+logger = logging.getLogger(__name__)
+
+# Shared storage visible to every worker (mounted data volume)
+XCOM_DIR = os.getenv('ARROW_XCOM_DIR', '/opt/airflow/data/xcom')
+
+# 'uncompressed' makes memory-mapped reads fully zero-copy
+XCOM_COMPRESSION = os.getenv('ARROW_XCOM_COMPRESSION', 'zstd')
+
+# Key marking an XCom value as a handle to an Arrow file
+HANDLE_KEY = '__arrow_xcom__'
+
+# Age after which sweep_expired_files deletes Arrow files
+XCOM_RETENTION_DAYS = float(os.getenv('ARROW_XCOM_RETENTION_DAYS', '7'))
+
+
+def sweep_expired_files(max_age_days: float = XCOM_RETENTION_DAYS) -> int:
+    """
+    Delete Arrow XCom files older than the retention period.
+    
+    Covers files whose rows are removed without a purge (finished runs,
+    `airflow db clean`).
+    
+    Args:
+        max_age_days: Minimum age of the files to delete
+        
+    Returns:
+        Number of files deleted
+    """
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    
+    try:
+        entries = os.scandir(XCOM_DIR)
+    except FileNotFoundError:
+        return 0
+    
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith('.arrow') or not entry.is_file():
+                continue
+            
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    removed += 1
+            except FileNotFoundError:
+                # Purged concurrently
+                pass
+    
+    logger.info(f"Removed {removed} Arrow XCom files older than {max_age_days} days")
+    return removed
+
+
+class ArrowXComBackend(BaseXCom):
+    """
+    XCom backend that stores DataFrames as Arrow IPC (Feather v2) files.
+    
+    Only a small JSON handle with the file path is written to the
+    metadata database; any other value uses the default serialization.
+    """
+    
+    @staticmethod
+    def serialize_value(
+        value: Any,
+        *,
+        key: str = None,
+        task_id: str = None,
+        dag_id: str = None,
+        run_id: str = None,
+        map_index: int = None,
+        **kwargs
+    ) -> Any:
+        """
+        Write DataFrames to Arrow IPC and serialize a handle to them.
+        
+        Args:
+            value: Value returned or pushed by the task
+            
+        Returns:
+            Serialized value to store in the metadata database
+        """
+        if isinstance(value, pd.DataFrame):
+            os.makedirs(XCOM_DIR, exist_ok=True)
+            path = os.path.join(
+                XCOM_DIR, f"{dag_id}__{task_id}__{uuid.uuid4().hex}.arrow"
+            )
+            
+            table = pa.Table.from_pandas(value)
+            feather.write_feather(table, path, compression=XCOM_COMPRESSION)
+            
+            logger.info(f"Stored {len(value)} rows for XCom at {path}")
+            value = {HANDLE_KEY: path}
+        
+        return BaseXCom.serialize_value(
+            value,
+            key=key,
+            task_id=task_id,
+            dag_id=dag_id,
+            run_id=run_id,
+            map_index=map_index
+        )
+    
+    @staticmethod
+    def deserialize_value(result) -> Any:
+        """
+        Resolve Arrow handles back into DataFrames.
+        
+        Args:
+            result: XCom row
+            
+        Returns:
+            Original value
+        """
+        value = BaseXCom.deserialize_value(result)
+        
+        if isinstance(value, dict) and HANDLE_KEY in value:
+            # Memory-map so a file still in the page cache (same worker
+            # under LocalExecutor) is read without an extra copy
+            table = feather.read_table(value[HANDLE_KEY], memory_map=True)
+            return table.to_pandas()
+        
+        return value
+    
+    @staticmethod
+    def purge(xcom, session) -> None:
+        """
+        Delete the Arrow file behind an XCom row that is being cleared.
+        
+        Args:
+            xcom: XCom row about to be deleted or overwritten
+            session: Metadata database session
+        """
+        value = BaseXCom.deserialize_value(xcom)
+        
+        if isinstance(value, dict) and HANDLE_KEY in value:
+            try:
+                os.remove(value[HANDLE_KEY])
+            except FileNotFoundError:
+                pass
+    
+    def orm_deserialize_value(self) -> Any:
+        """Show the handle in the UI instead of loading the DataFrame."""
+        return BaseXCom.deserialize_value(self)
@@ -3,15 +3,32 @@ API Extractor Module
 Extracts data from REST APIs with retry logic and error handling.
 """
 
+import asyncio
+import aiohttp
+from aiohttp_retry import ExponentialRetry, RetryClient
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
 import time
 import logging
-from typing import Dict, List, Optional
-import json
+from typing import Any, Dict, List, Optional, Tuple
+import orjson
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Connections kept alive per host
+POOL_SIZE = 32
+
+# Server-side errors worth retrying
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+# Keys commonly holding the record list in a JSON object response
+RECORD_KEYS = ('data', 'results', 'items', 'records')
+
+# Keys signalling another page, in order of preference
+NEXT_PAGE_KEYS = ('next', 'next_page', 'total_pages')
+
 
 class APIExtractor:
     """
@@ -19,8 +36,9 @@ class APIExtractor:
     
     Features:
     - Automatic retry with exponential backoff
+    - Keep-alive connection pooling and compressed responses
     - Rate limiting
-    - Pagination support
+    - Pagination support (concurrent when the page count is known)
     - Response validation
     """
     
@@ -46,6 +64,29 @@ class APIExtractor:
         self.timeout = timeout
         self.session = requests.Session()
         
+        # Endpoint -> (records key, next-page indicator, page advance key)
+        self._schema_cache: Dict[str, Tuple[Optional[str], ...]] = {}
+        
+        # Retries and backoff run inside urllib3; a larger keep-alive pool
+        # avoids reconnecting (and new TLS handshakes) across pages
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=1,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=None,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=retry
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Advertise every content encoding urllib3 can decode here
+        self.session.headers.update(make_headers(accept_encoding=True))
+        
         if api_key:
             self.session.headers.update({'Authorization': f'Bearer {api_key}'})
         
@@ -76,15 +117,27 @@ class APIExtractor:
         
         try:
             response = self._make_request(url, params, method)
-            data = self._parse_response(response)
-            all_data.extend(data)
+            payload = self._decode_response(response)
             
-            # Handle pagination if present
-            while self._has_next_page(response):
-                params = self._get_next_page_params(response, params)
+            # Response layout is fixed per endpoint; learn what this page shows
+            self._learn_schema(endpoint, payload)
+            
+            all_data.extend(self._parse_response(payload, endpoint))
+            
+            # Page count known up front: fetch the remaining pages at once
+            remaining_pages = self._remaining_pages(payload, endpoint)
+            if remaining_pages:
+                all_data.extend(self._fetch_pages_concurrently(
+                    url, params, method, endpoint, remaining_pages
+                ))
+                payload = None
+            
+            # Otherwise follow pagination page by page
+            while self._has_next_page(payload, endpoint):
+                params = self._get_next_page_params(payload, params, endpoint)
                 response = self._make_request(url, params, method)
-                data = self._parse_response(response)
-                all_data.extend(data)
+                payload = self._decode_response(response)
+                all_data.extend(self._parse_response(payload, endpoint))
             
             duration = time.time() - start_time
             logger.info(
@@ -105,7 +158,10 @@ class APIExtractor:
         method: str
     ) -> requests.Response:
         """
-        Make HTTP request with retry logic.
+        Make HTTP request.
+        
+        Retries with exponential backoff are handled by the session's
+        urllib3 adapter.
         
         Args:
             url: Request URL
@@ -115,117 +171,310 @@ class APIExtractor:
         Returns:
             Response object
         """
-        for attempt in range(self.max_retries):
-            try:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    timeout=self.timeout
-                )
-                
-                response.raise_for_status()
-                return response
-                
-            except requests.exceptions.RequestException as e:
-                wait_time = 2 ** attempt  # Exponential backoff
-                logger.warning(
-                    f"Request failed (attempt {attempt + 1}/{self.max_retries}): {e}"
-                )
-                
-                if attempt < self.max_retries - 1:
-                    logger.info(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error("Max retries exceeded")
-                    raise
+        try:
+            response = self.session.request(
+                method=method,
+                url=url,
+                params=params,
+                timeout=self.timeout
+            )
+            
+            response.raise_for_status()
+            return response
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request failed after {self.max_retries} retries: {e}")
+            raise
     
-    def _parse_response(self, response: requests.Response) -> List[Dict]:
+    def _remaining_pages(
+        self,
+        data: Any,
+        endpoint: str
+    ) -> List[int]:
         """
-        Parse API response to extract data.
+        List pages still to fetch when the first page reports the total.
         
         Args:
-            response: HTTP response object
+            data: Decoded JSON payload of the first page
+            endpoint: Endpoint whose cached schema to use
             
         Returns:
-            List of data records
+            Page numbers left to fetch (empty if unknown)
         """
+        schema = self._schema_cache.get(endpoint)
+        if schema is None or schema[1:] != ('total_pages', 'page'):
+            return []
+        
+        page = data.get('page')
+        total_pages = data.get('total_pages')
+        if not isinstance(page, int) or not isinstance(total_pages, int):
+            return []
+        
+        # asyncio.run() cannot nest inside an already running event loop
         try:
-            data = response.json()
+            asyncio.get_running_loop()
+            return []
+        except RuntimeError:
+            pass
+        
+        return list(range(page + 1, total_pages + 1))
+    
+    def _fetch_pages_concurrently(
+        self,
+        url: str,
+        params: Optional[Dict],
+        method: str,
+        endpoint: str,
+        pages: List[int]
+    ) -> List[Dict]:
+        """
+        Fetch known pages concurrently and parse their records.
+        
+        Args:
+            url: Request URL
+            params: Query parameters of the first page
+            method: HTTP method
+            endpoint: Endpoint whose cached schema to use
+            pages: Page numbers to fetch
             
-            # Handle different response structures
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict):
-                # Common patterns: data, results, items, etc.
-                for key in ['data', 'results', 'items', 'records']:
-                    if key in data and isinstance(data[key], list):
-                        return data[key]
-                # If no list found, return the dict as single item
-                return [data]
-            else:
-                logger.warning(f"Unexpected response type: {type(data)}")
-                return []
-                
-        except json.JSONDecodeError as e:
+        Returns:
+            Records from all pages, in page order
+        """
+        logger.info(f"Fetching {len(pages)} remaining pages concurrently")
+        
+        payloads = asyncio.run(self._gather_pages(url, params, method, pages))
+        
+        records = []
+        for payload in payloads:
+            records.extend(self._parse_response(payload, endpoint))
+        
+        return records
+    
+    async def _gather_pages(
+        self,
+        url: str,
+        params: Optional[Dict],
+        method: str,
+        pages: List[int]
+    ) -> List[Any]:
+        """
+        Request pages over one aiohttp connection pool.
+        
+        Args:
+            url: Request URL
+            params: Query parameters of the first page
+            method: HTTP method
+            pages: Page numbers to fetch
+            
+        Returns:
+            Decoded payloads, in page order
+        """
+        headers = {
+            key: value for key, value in self.session.headers.items()
+            if key.lower() != 'connection'
+        }
+        retry_options = ExponentialRetry(
+            attempts=self.max_retries + 1,
+            start_timeout=1,
+            statuses=set(RETRY_STATUS_CODES)
+        )
+        
+        async with RetryClient(
+            retry_options=retry_options,
+            connector=aiohttp.TCPConnector(limit=POOL_SIZE),
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as client:
+            async def fetch(page: int) -> Any:
+                page_params = {**(params or {}), 'page': page}
+                async with client.request(method, url, params=page_params) as response:
+                    response.raise_for_status()
+                    return orjson.loads(await response.read())
+            
+            return await asyncio.gather(*(fetch(page) for page in pages))
+    
+    def _decode_response(self, response: requests.Response) -> Any:
+        """
+        Decode JSON body of a response once.
+        
+        Args:
+            response: HTTP response object
+            
+        Returns:
+            Decoded JSON payload
+        """
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
             raise
     
-    def _has_next_page(self, response: requests.Response) -> bool:
+    def _learn_schema(self, endpoint: str, data: Any) -> None:
+        """
+        Cache the parts of an endpoint's layout found in a payload.
+        
+        Only keys actually present are cached; parts still unknown (e.g.
+        pagination on a single-page response) are discovered on later
+        calls and left to generic probing meanwhile.
+        
+        Args:
+            endpoint: API endpoint path
+            data: Decoded JSON payload of the first page
+        """
+        cached = self._schema_cache.get(endpoint, (None, None, None))
+        if all(part is not None for part in cached):
+            return
+        
+        schema = tuple(
+            known if known is not None else found
+            for known, found in zip(cached, self._discover_schema(data))
+        )
+        if any(part is not None for part in schema):
+            self._schema_cache[endpoint] = schema
+    
+    def _discover_schema(self, data: Any) -> Tuple[Optional[str], ...]:
+        """
+        Discover where records and pagination info live in a payload.
+        
+        Args:
+            data: Decoded JSON payload of the first page
+            
+        Returns:
+            Tuple of (records key, next-page indicator, page advance key);
+            each is None when not present
+        """
+        if not isinstance(data, dict):
+            return (None, None, None)
+        
+        records_key = next(
+            (key for key in RECORD_KEYS if isinstance(data.get(key), list)),
+            None
+        )
+        next_indicator = next(
+            (key for key in NEXT_PAGE_KEYS if key in data),
+            None
+        )
+        advance_key = next(
+            (key for key in ('page', 'offset') if key in data),
+            None
+        )
+        
+        return (records_key, next_indicator, advance_key)
+    
+    def _parse_response(
+        self,
+        data: Any,
+        endpoint: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Extract data records from a decoded response payload.
+        
+        Args:
+            data: Decoded JSON payload
+            endpoint: Endpoint whose cached schema to use, if any
+            
+        Returns:
+            List of data records
+        """
+        schema = self._schema_cache.get(endpoint)
+        if schema is not None:
+            records_key = schema[0]
+            if records_key is None and isinstance(data, list):
+                return data
+            if records_key is not None and isinstance(data, dict):
+                records = data.get(records_key)
+                if isinstance(records, list):
+                    return records
+        
+        # Handle different response structures
+        if isinstance(data, list):
+            return data
+        elif isinstance(data, dict):
+            # Common patterns: data, results, items, etc.
+            for key in RECORD_KEYS:
+                if key in data and isinstance(data[key], list):
+                    return data[key]
+            # If no list found, return the dict as single item
+            return [data]
+        else:
+            logger.warning(f"Unexpected response type: {type(data)}")
+            return []
+    
+    def _has_next_page(
+        self,
+        data: Any,
+        endpoint: Optional[str] = None
+    ) -> bool:
         """
         Check if there are more pages to fetch.
         
         Args:
-            response: HTTP response object
+            data: Decoded JSON payload
+            endpoint: Endpoint whose cached schema to use, if any
             
         Returns:
             True if next page exists
         """
+        if not isinstance(data, dict):
+            return False
+        
         try:
-            data = response.json()
+            schema = self._schema_cache.get(endpoint)
+            indicator = schema[1] if schema is not None else None
+            if indicator is not None and indicator in data:
+                if indicator == 'total_pages':
+                    return data.get('page', 0) < data.get('total_pages', 0)
+                return data.get(indicator) is not None
             
             # Check common pagination indicators
-            if isinstance(data, dict):
-                return (
-                    data.get('next') is not None or
-                    data.get('next_page') is not None or
-                    (data.get('page', 0) < data.get('total_pages', 0))
-                )
-            
-            return False
-            
-        except:
+            return (
+                data.get('next') is not None or
+                data.get('next_page') is not None or
+                (data.get('page', 0) < data.get('total_pages', 0))
+            )
+        except TypeError:
             return False
     
     def _get_next_page_params(
         self,
-        response: requests.Response,
-        current_params: Optional[Dict]
+        data: Any,
+        current_params: Optional[Dict],
+        endpoint: Optional[str] = None
     ) -> Dict:
         """
         Get parameters for next page request.
         
         Args:
-            response: Current response object
+            data: Decoded JSON payload of the current page
             current_params: Current query parameters
+            endpoint: Endpoint whose cached schema to use, if any
             
         Returns:
             Updated parameters for next page
         """
         params = current_params.copy() if current_params else {}
         
+        if not isinstance(data, dict):
+            return params
+        
+        schema = self._schema_cache.get(endpoint)
+        if schema is not None and schema[2] is not None and schema[2] in data:
+            advance_key = schema[2]
+        elif 'page' in data:
+            advance_key = 'page'
+        elif 'offset' in data:
+            advance_key = 'offset'
+        else:
+            advance_key = None
+        
         try:
-            data = response.json()
-            
-            if isinstance(data, dict):
-                # Increment page number
-                if 'page' in data:
-                    params['page'] = data['page'] + 1
-                elif 'offset' in data:
-                    limit = data.get('limit', 100)
-                    params['offset'] = data['offset'] + limit
-                    
-        except:
+            # Increment page number
+            if advance_key == 'page':
+                params['page'] = data['page'] + 1
+            elif advance_key == 'offset':
+                limit = data.get('limit', 100)
+                params['offset'] = data['offset'] + limit
+        except (KeyError, TypeError):
             pass
         
         return params
@@ -251,8 +500,8 @@ class APIExtractor:
         """
         data = self.extract(endpoint, params, method)
         
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Data saved to {output_path}")
         return len(data)
@@ -3,14 +3,49 @@ CSV Extractor Module
 Extracts data from CSV files with validation and error handling.
 """
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import logging
-from typing import List, Optional, Dict
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Dict
 from pathlib import Path
-import chardet
+import codecs
+import csv
+import charset_normalizer
 
 logger = logging.getLogger(__name__)
 
+# Rows per chunk when streaming and no chunk_size was configured
+DEFAULT_CHUNK_SIZE = 100_000
+
+SUPPORTED_BACKENDS = ('pandas', 'pyarrow')
+
+# Bytes scanned per step when counting lines (bounds temporary memory)
+LINE_COUNT_BLOCK_SIZE = 64 * 1024 * 1024
+
+NEWLINE = 0x0A
+
+# Bytes read by get_file_info to infer column types
+INFO_BLOCK_SIZE = 64 * 1024
+
+# Bytes inspected when detecting encoding
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# Byte-order marks, longest first (UTF-32 LE starts with the UTF-16 LE BOM)
+BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
 
 class CSVExtractor:
     """
@@ -21,13 +56,15 @@ class CSVExtractor:
     - Schema validation
     - Chunked reading for large files
     - Multiple delimiter support
+    - Multi-threaded PyArrow parser backend
     """
     
     def __init__(
         self,
         delimiter: str = ',',
         encoding: Optional[str] = None,
-        chunk_size: Optional[int] = None
+        chunk_size: Optional[int] = None,
+        backend: str = 'pandas'
     ):
         """
         Initialize CSV Extractor.
@@ -36,10 +73,15 @@ class CSVExtractor:
             delimiter: CSV delimiter (default: comma)
             encoding: File encoding (auto-detected if None)
             chunk_size: Number of rows to read at once (None for all)
+            backend: CSV parser to use ('pandas' or 'pyarrow')
         """
+        if backend not in SUPPORTED_BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        
         self.delimiter = delimiter
         self.encoding = encoding
         self.chunk_size = chunk_size
+        self.backend = backend
         
         logger.info("CSVExtractor initialized")
     
@@ -75,6 +117,10 @@ class CSVExtractor:
                 df = self._read_in_chunks(
                     file_path, encoding, columns, dtypes
                 )
+            elif self.backend == 'pyarrow':
+                df = self._read_with_pyarrow(
+                    file_path, encoding, columns, dtypes
+                )
             else:
                 df = pd.read_csv(
                     file_path,
@@ -100,6 +146,9 @@ class CSVExtractor:
         """
         Detect file encoding.
         
+        Checks for a byte-order mark, then tries a strict UTF-8 decode of
+        the first bytes; statistical detection only runs if both fail.
+        
         Args:
             file_path: Path to file
             
@@ -107,18 +156,77 @@ class CSVExtractor:
             Detected encoding
         """
         with open(file_path, 'rb') as f:
-            result = chardet.detect(f.read(10000))
+            sample = f.read(ENCODING_SAMPLE_SIZE)
         
-        encoding = result['encoding']
-        confidence = result['confidence']
+        for bom, encoding in BOM_ENCODINGS:
+            if sample.startswith(bom):
+                logger.info(f"Detected encoding from BOM: {encoding}")
+                return encoding
         
-        logger.info(
-            f"Detected encoding: {encoding} "
-            f"(confidence: {confidence:.2%})"
-        )
+        try:
+            # Incremental decode tolerates a multi-byte char cut at the end
+            codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+            logger.info("Detected encoding: utf-8")
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+        
+        best = charset_normalizer.from_bytes(sample).best()
+        encoding = best.encoding if best else 'utf-8'
+        
+        logger.info(f"Detected encoding: {encoding} (charset-normalizer)")
         
         return encoding
     
+    def _read_with_pyarrow(
+        self,
+        file_path: str,
+        encoding: str,
+        columns: Optional[List[str]],
+        dtypes: Optional[Dict]
+    ) -> pd.DataFrame:
+        """
+        Read CSV with PyArrow's multi-threaded parser.
+        
+        Args:
+            file_path: Path to CSV file
+            encoding: File encoding
+            columns: Columns to extract
+            dtypes: Data types
+            
+        Returns:
+            DataFrame with extracted data
+        """
+        column_types = {}
+        post_casts = {}
+        
+        # Arrow parses numpy-compatible types directly; anything else
+        # (e.g. 'category') is applied after conversion to pandas
+        for col, dtype in (dtypes or {}).items():
+            try:
+                column_types[col] = pa.from_numpy_dtype(
+                    pd.api.types.pandas_dtype(dtype)
+                )
+            except (TypeError, NotImplementedError, pa.ArrowNotImplementedError):
+                post_casts[col] = dtype
+        
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(encoding=encoding),
+            parse_options=pa_csv.ParseOptions(delimiter=self.delimiter),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=columns,
+                column_types=column_types
+            )
+        )
+        
+        df = table.to_pandas()
+        
+        if post_casts:
+            df = df.astype(post_casts)
+        
+        return df
+    
     def _read_in_chunks(
         self,
         file_path: str,
@@ -140,23 +248,126 @@ class CSVExtractor:
         """
         logger.info(f"Reading file in chunks of {self.chunk_size} rows")
         
-        chunks = []
+        df = pd.concat(
+            self._iter_chunks(file_path, encoding, columns, dtypes, self.chunk_size),
+            ignore_index=True
+        )
+        logger.info(f"Combined chunks into {len(df)} rows")
+        
+        return df
+    
+    def _iter_chunks(
+        self,
+        file_path: str,
+        encoding: str,
+        columns: Optional[List[str]],
+        dtypes: Optional[Dict],
+        chunk_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Lazily yield CSV chunks without holding previous ones in memory.
         
-        for chunk in pd.read_csv(
+        Args:
+            file_path: Path to CSV file
+            encoding: File encoding
+            columns: Columns to extract
+            dtypes: Data types
+            chunk_size: Number of rows per chunk
+            
+        Yields:
+            One DataFrame per chunk
+        """
+        with pd.read_csv(
             file_path,
             delimiter=self.delimiter,
             encoding=encoding,
             usecols=columns,
             dtype=dtypes,
-            chunksize=self.chunk_size,
+            chunksize=chunk_size,
             low_memory=False
-        ):
-            chunks.append(chunk)
+        ) as reader:
+            yield from reader
+    
+    def extract_chunks(
+        self,
+        file_path: str,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[Dict] = None,
+        chunk_size: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Extract CSV file as a stream of DataFrame chunks.
         
-        df = pd.concat(chunks, ignore_index=True)
-        logger.info(f"Combined {len(chunks)} chunks")
+        Args:
+            file_path: Path to CSV file
+            columns: Columns to extract
+            dtypes: Data types for columns
+            chunk_size: Rows per chunk (default: configured chunk_size,
+                then DEFAULT_CHUNK_SIZE)
+            
+        Yields:
+            One DataFrame per chunk
+        """
+        if not Path(file_path).exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
         
-        return df
+        encoding = self.encoding or self._detect_encoding(file_path)
+        chunk_size = chunk_size or self.chunk_size or DEFAULT_CHUNK_SIZE
+        
+        logger.info(f"Streaming {file_path} in chunks of {chunk_size} rows")
+        
+        yield from self._iter_chunks(
+            file_path, encoding, columns, dtypes, chunk_size
+        )
+    
+    def extract_to_parquet(
+        self,
+        file_path: str,
+        output_path: str,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[Dict] = None
+    ) -> int:
+        """
+        Stream CSV file into a Parquet file chunk by chunk.
+        
+        Peak memory is a single chunk, so this works for files larger
+        than RAM. The Parquet schema is taken from the first chunk; pass
+        ``dtypes`` to pin columns whose inferred type may vary.
+        
+        Args:
+            file_path: Path to CSV file
+            output_path: Path to save Parquet file
+            columns: Columns to extract
+            dtypes: Data types for columns
+            
+        Returns:
+            Number of rows written
+        """
+        logger.info(f"Streaming {file_path} to {output_path}")
+        
+        writer = None
+        rows_written = 0
+        
+        try:
+            for chunk in self.extract_chunks(file_path, columns, dtypes):
+                if writer is None:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    writer = pq.ParquetWriter(
+                        output_path, table.schema, compression='zstd'
+                    )
+                else:
+                    table = pa.Table.from_pandas(
+                        chunk, schema=writer.schema, preserve_index=False
+                    )
+                
+                writer.write_table(table)
+                rows_written += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        logger.info(f"Data saved to {output_path}. Rows: {rows_written}")
+        return rows_written
     
     def extract_multiple(
         self,
@@ -175,16 +386,27 @@ class CSVExtractor:
         """
         logger.info(f"Extracting from {len(file_paths)} files")
         
+        if self.backend == 'pyarrow' and not self.chunk_size:
+            combined_df = self._extract_dataset(file_paths, columns)
+            if combined_df is not None:
+                logger.info(
+                    f"Combined extraction completed. "
+                    f"Total rows: {len(combined_df)}"
+                )
+                return combined_df
+        
         dfs = []
         
-        for file_path in file_paths:
-            try:
-                df = self.extract(file_path, columns)
-                df['source_file'] = Path(file_path).name
-                dfs.append(df)
-            except Exception as e:
-                logger.warning(f"Failed to extract {file_path}: {e}")
-                continue
+        # Parsing releases the GIL inside pandas/pyarrow C code, so
+        # threads are enough to read files concurrently
+        if file_paths:
+            max_workers = min(len(file_paths), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(
+                    lambda path: self._extract_tagged(path, columns),
+                    file_paths
+                )
+                dfs = [df for df in results if df is not None]
         
         if not dfs:
             raise ValueError("No files were successfully extracted")
@@ -198,6 +420,100 @@ class CSVExtractor:
         
         return combined_df
     
+    def _extract_dataset(
+        self,
+        file_paths: List[str],
+        columns: Optional[List[str]]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Read several CSV files as one Arrow dataset.
+        
+        Files are scanned in parallel into a single table with a unified
+        schema (columns missing from a file become nulls), and
+        'source_file' is added per batch as a dictionary-encoded column.
+        
+        Args:
+            file_paths: List of CSV file paths
+            columns: Columns to extract
+            
+        Returns:
+            Combined DataFrame, or None if the files need the per-file
+            path (mixed encodings, incompatible schemas, malformed files)
+        """
+        existing = []
+        for file_path in file_paths:
+            if Path(file_path).exists():
+                existing.append(file_path)
+            else:
+                logger.warning(f"Failed to extract {file_path}: file not found")
+        
+        if not existing:
+            raise ValueError("No files were successfully extracted")
+        
+        encodings = {
+            self.encoding or self._detect_encoding(path) for path in existing
+        }
+        if len(encodings) > 1:
+            logger.info(f"Mixed encodings {encodings}, reading files separately")
+            return None
+        
+        csv_format = ds.CsvFileFormat(
+            parse_options=pa_csv.ParseOptions(delimiter=self.delimiter),
+            read_options=pa_csv.ReadOptions(encoding=encodings.pop())
+        )
+        try:
+            # Permissive promotion widens e.g. int64 + double to double
+            schema = pa.unify_schemas(
+                [ds.dataset(path, format=csv_format).schema for path in existing],
+                promote_options='permissive'
+            )
+            dataset = ds.dataset(existing, schema=schema, format=csv_format)
+            
+            batches = []
+            for tagged in dataset.scanner(columns=columns).scan_batches():
+                batch = tagged.record_batch
+                source_file = pa.DictionaryArray.from_arrays(
+                    pa.array(np.zeros(batch.num_rows, dtype=np.int32)),
+                    pa.array([Path(tagged.fragment.path).name])
+                )
+                batches.append(pa.RecordBatch.from_arrays(
+                    batch.columns + [source_file],
+                    names=batch.schema.names + ['source_file']
+                ))
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            # Incompatible column types or a malformed file: the per-file
+            # path skips and logs bad files instead of failing the call
+            logger.info(f"Dataset read failed ({e}), reading files separately")
+            return None
+        
+        if not batches:
+            return pd.DataFrame(columns=(columns or schema.names) + ['source_file'])
+        
+        return pa.Table.from_batches(batches).to_pandas()
+    
+    def _extract_tagged(
+        self,
+        file_path: str,
+        columns: Optional[List[str]]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Extract one file and tag rows with its name.
+        
+        Args:
+            file_path: Path to CSV file
+            columns: Columns to extract
+            
+        Returns:
+            DataFrame with 'source_file' column, or None if extraction failed
+        """
+        try:
+            df = self.extract(file_path, columns)
+            df['source_file'] = Path(file_path).name
+            return df
+        except Exception as e:
+            logger.warning(f"Failed to extract {file_path}: {e}")
+            return None
+    
     def validate_schema(
         self,
         df: pd.DataFrame,
@@ -229,6 +545,39 @@ class CSVExtractor:
         logger.info("Schema validation passed")
         return True
     
+    def _count_lines(self, file_path: str) -> int:
+        """
+        Count lines by scanning raw bytes for newlines.
+        
+        The file is memory-mapped and scanned in blocks with NumPy, so no
+        per-line strings are decoded or allocated.
+        
+        Args:
+            file_path: Path to file
+            
+        Returns:
+            Number of lines (a last line without trailing newline counts)
+        """
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return 0
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = np.frombuffer(mm, dtype=np.uint8)
+                line_count = 0
+                for start in range(0, size, LINE_COUNT_BLOCK_SIZE):
+                    block = data[start:start + LINE_COUNT_BLOCK_SIZE]
+                    line_count += int(np.count_nonzero(block == NEWLINE))
+                
+                if data[-1] != NEWLINE:
+                    line_count += 1
+                
+                # Release the buffer before the mmap is closed
+                del data, block
+        
+        return line_count
+    
     def get_file_info(self, file_path: str) -> Dict:
         """
         Get information about CSV file.
@@ -241,20 +590,32 @@ class CSVExtractor:
         """
         path = Path(file_path)
         
-        # Quick read to get column info
-        df_sample = pd.read_csv(file_path, nrows=5)
+        # Column names straight from the header line
+        with open(file_path, 'rb') as f:
+            header = f.readline().decode('utf-8-sig', 'replace')
+        columns = next(csv.reader([header], delimiter=self.delimiter), [])
+        
+        # Types inferred from the first small Arrow block only
+        reader = pa_csv.open_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(block_size=INFO_BLOCK_SIZE),
+            parse_options=pa_csv.ParseOptions(delimiter=self.delimiter)
+        )
+        dtypes = {
+            field.name: np.dtype(field.type.to_pandas_dtype())
+            for field in reader.schema
+        }
         
         # Count total rows
-        with open(file_path, 'r') as f:
-            row_count = sum(1 for _ in f) - 1  # -1 for header
+        row_count = self._count_lines(file_path) - 1  # -1 for header
         
         info = {
             'file_name': path.name,
             'file_size_mb': path.stat().st_size / (1024 * 1024),
             'row_count': row_count,
-            'column_count': len(df_sample.columns),
-            'columns': df_sample.columns.tolist(),
-            'dtypes': df_sample.dtypes.to_dict()
+            'column_count': len(columns),
+            'columns': columns,
+            'dtypes': dtypes
         }
         
         logger.info(f"File info: {info}")
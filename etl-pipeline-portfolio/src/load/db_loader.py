@@ -4,21 +4,174 @@ Loads data into PostgreSQL with different strategies.
 """
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import csv
+import io
 import logging
-from typing import Optional, List
+from typing import Any, Iterator, Optional, List
 from sqlalchemy import create_engine, text, inspect
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.exc import ProgrammingError
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+try:
+    from pgcopy import CopyManager
+except ImportError:  # pragma: no cover - binary COPY is optional
+    CopyManager = None
 
 logger = logging.getLogger(__name__)
 
+# SQLSTATEs of a missing table or schema, and of a missing column
+PG_UNDEFINED_RELATION = ('42P01', '3F000')
+PG_UNDEFINED_COLUMN = '42703'
+
+# Custom setting read by the etl_batch_id column default
+ETL_BATCH_ID_SETTING = 'etl.batch_id'
+
+# Server-side ETL metadata columns: (name, type, default expression)
+ETL_METADATA_COLUMNS = (
+    ('etl_loaded_at', 'TIMESTAMPTZ', 'now()'),
+    ('etl_batch_id', 'TEXT',
+     f"NULLIF(current_setting('{ETL_BATCH_ID_SETTING}', true), '')"),
+)
+
+# Rows per batch for to_sql chunks and COPY serialization
+DEFAULT_BATCH_SIZE = 10_000
+
+# Rows per INSERT chunk when filling the upsert staging table
+UPSERT_STAGING_CHUNK_SIZE = 50_000
+
+# Session settings for index builds (parallel B-tree sort, PostgreSQL 11+)
+INDEX_BUILD_WORKERS = 8
+INDEX_BUILD_WORK_MEM = '2GB'
+
+# Transaction settings for bulk loads (see DatabaseLoader._begin_bulk)
+BULK_SYNCHRONOUS_COMMIT = 'off'
+BULK_WORK_MEM = '256MB'
+
+# Concurrent COPY workers for partitioned loads (each holds a pooled connection)
+PARTITION_COPY_WORKERS = 8
+
+# Seconds a reflected table-name listing stays valid
+TABLE_NAMES_CACHE_TTL = 60
+
+# psycopg2 fast-execution helpers for executemany (to_sql paths)
+PSYCOPG2_ENGINE_OPTIONS = {
+    'executemany_mode': 'values_plus_batch',
+    'insertmanyvalues_page_size': 1000,
+    'executemany_batch_page_size': 500,
+}
+
+# NULL marker in COPY text format
+COPY_NULL = r'\N'
+
+
+# Characters COPY text format requires escaped, backslash first
+COPY_ESCAPES = (
+    ('\\', '\\\\'),
+    ('\n', '\\n'),
+    ('\r', '\\r'),
+    ('\t', '\\t'),
+)
+COPY_ESCAPE_TABLE = str.maketrans(dict(COPY_ESCAPES))
+
+
+def _escape_copy_value(value):
+    """Escape a string for COPY text format; other values pass through."""
+    if not isinstance(value, str):
+        return value
+    
+    return value.translate(COPY_ESCAPE_TABLE)
+
+
+def _escape_copy_arrow(array: pa.Array) -> pa.Array:
+    """Escape an Arrow string array in C++; dictionaries escape values only."""
+    if pa.types.is_dictionary(array.type):
+        return pa.DictionaryArray.from_arrays(
+            array.indices, _escape_copy_arrow(array.dictionary)
+        )
+    
+    for char, escaped in COPY_ESCAPES:
+        array = pc.replace_substring(array, pattern=char, replacement=escaped)
+    
+    return array
+
+
+def _is_arrow_string(dtype) -> bool:
+    """Check for an ArrowDtype holding (dictionary-encoded) strings."""
+    if not isinstance(dtype, pd.ArrowDtype):
+        return False
+    
+    arrow_type = dtype.pyarrow_dtype
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    
+    return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+
+
+def _escape_copy_column(series: pd.Series) -> pd.Series:
+    """Escape a text column for COPY text format."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Escape each category once instead of every row
+        return series.cat.rename_categories(
+            series.cat.categories.map(_escape_copy_value)
+        )
+    
+    if _is_arrow_string(series.dtype):
+        escaped = _escape_copy_arrow(pa.array(series.array))
+        return pd.Series(
+            pd.arrays.ArrowExtensionArray(escaped),
+            index=series.index,
+            name=series.name
+        )
+    
+    return series.map(_escape_copy_value)
+
+
+class _ChunkStream(io.TextIOBase):
+    """
+    Read-only text stream over an iterator of string chunks.
+    
+    Lets psycopg2's copy_expert pull CSV lazily, one batch at a time,
+    instead of from a fully materialized buffer.
+    """
+    
+    def __init__(self, chunks: Iterator[str]):
+        self._chunks = chunks
+        self._pending = ''
+        self._offset = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def read(self, size: Optional[int] = -1) -> str:
+        if size is None or size < 0:
+            data = self._pending[self._offset:] + ''.join(self._chunks)
+            self._pending, self._offset = '', 0
+            return data
+        
+        # Serve from the current chunk only (short reads are allowed),
+        # advancing an offset rather than re-slicing the remainder
+        while self._offset >= len(self._pending):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return ''
+            self._pending, self._offset = chunk, 0
+        
+        data = self._pending[self._offset:self._offset + size]
+        self._offset += len(data)
+        return data
+
 
 class DatabaseLoader:
     """
     Load data into PostgreSQL database.
     
     Features:
-    - Multiple load strategies (append, replace, upsert)
+    - Multiple load strategies (append, replace, upsert, copy)
     - Batch processing
     - Transaction management
     - Performance optimization
@@ -38,7 +191,20 @@ class DatabaseLoader:
         """
         self.connection_string = connection_string
         self.schema = schema
-        self.engine = create_engine(connection_string)
+        url = make_url(connection_string)
+        engine_options = (
+            PSYCOPG2_ENGINE_OPTIONS
+            if url.get_driver_name() == 'psycopg2' else {}
+        )
+        self.engine = create_engine(connection_string, **engine_options)
+        
+        # COPY is PostgreSQL-only; other backends fall back to to_sql
+        self._use_copy = self.engine.dialect.name == 'postgresql'
+        
+        # Reflection is created lazily and cached between calls
+        self._inspector = None
+        self._table_names = None
+        self._table_names_fetched_at = 0.0
         
         logger.info(f"DatabaseLoader initialized for schema: {schema}")
     
@@ -47,8 +213,12 @@ class DatabaseLoader:
         df: pd.DataFrame,
         table_name: str,
         strategy: str = 'append',
-        batch_size: int = 1000,
-        create_index: Optional[List[str]] = None
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        create_index: Optional[List[str]] = None,
+        batch_id: Optional[str] = None,
+        drop_indexes_during_load: bool = False,
+        concurrent_indexes: bool = False,
+        partition_by: Optional[str] = None
     ) -> int:
         """
         Load DataFrame into database table.
@@ -56,9 +226,22 @@ class DatabaseLoader:
         Args:
             df: DataFrame to load
             table_name: Target table name
-            strategy: Load strategy ('append', 'replace', 'upsert')
-            batch_size: Number of rows per batch
+            strategy: Load strategy ('append', 'replace', 'upsert', 'copy')
+            batch_size: Rows per to_sql chunk; COPY always sends one
+                stream and only serializes in batches of this size
             create_index: Columns to create index on
+            batch_id: Batch identifier stamped server-side into the
+                etl_batch_id/etl_loaded_at columns ('copy' strategy only)
+            drop_indexes_during_load: Drop the table's secondary indexes
+                for 'append'/'copy' loads and rebuild them afterwards;
+                only pays off when the load is large relative to the
+                table, since rebuilding rescans every existing row
+            concurrent_indexes: Build create_index indexes with
+                CREATE INDEX CONCURRENTLY (no write lock on live tables)
+            partition_by: Date column of a monthly-partitioned PostgreSQL
+                table; rows are COPYed straight into the existing
+                {table_name}_YYYY_MM children in parallel
+                ('append'/'copy' strategies only)
             
         Returns:
             Number of rows loaded
@@ -68,21 +251,63 @@ class DatabaseLoader:
             f"(strategy: {strategy})"
         )
         
+        if batch_id is not None and strategy != 'copy':
+            raise ValueError("batch_id requires strategy='copy'")
+        
+        if partition_by is not None:
+            if not self._use_copy:
+                raise ValueError("partition_by requires PostgreSQL")
+            if strategy not in ('append', 'copy'):
+                raise ValueError(
+                    "partition_by requires strategy='append' or 'copy'"
+                )
+        
         start_time = time.time()
         
+        # replace recreates the table; upsert may need indexes for ON CONFLICT;
+        # partitioned indexes cascade to every child
+        drop_indexes = (
+            drop_indexes_during_load
+            and self._use_copy
+            and strategy in ('append', 'copy')
+            and partition_by is None
+        )
+        
         try:
-            if strategy == 'append':
-                rows_loaded = self._load_append(df, table_name, batch_size)
-            elif strategy == 'replace':
-                rows_loaded = self._load_replace(df, table_name, batch_size)
-            elif strategy == 'upsert':
-                rows_loaded = self._load_upsert(df, table_name, batch_size)
-            else:
-                raise ValueError(f"Unknown strategy: {strategy}")
+            index_defs = (
+                self._snapshot_and_drop_indexes(table_name)
+                if drop_indexes else []
+            )
+            
+            try:
+                if partition_by is not None:
+                    rows_loaded = self._load_partitioned(
+                        df, table_name, partition_by, batch_size, batch_id
+                    )
+                elif strategy == 'append':
+                    rows_loaded = self._load_append(df, table_name, batch_size)
+                elif strategy == 'replace':
+                    rows_loaded = self._load_replace(df, table_name, batch_size)
+                elif strategy == 'upsert':
+                    rows_loaded = self._load_upsert(df, table_name, batch_size)
+                elif strategy == 'copy':
+                    rows_loaded = self._load_copy(
+                        df, table_name, batch_size, batch_id
+                    )
+                else:
+                    raise ValueError(f"Unknown strategy: {strategy}")
+            finally:
+                if index_defs:
+                    self._recreate_indexes(index_defs)
+                
+                # Loads may have created or replaced the table
+                self._invalidate_table_cache()
             
             # Create indexes if specified
             if create_index:
-                self._create_indexes(table_name, create_index)
+                self._create_indexes(
+                    table_name, create_index, concurrent=concurrent_indexes
+                )
             
             duration = time.time() - start_time
             logger.info(
@@ -100,11 +325,13 @@ class DatabaseLoader:
         self,
         df: pd.DataFrame,
         table_name: str,
-        batch_size: int
+        batch_size: int = DEFAULT_BATCH_SIZE
     ) -> int:
         """
         Load data by appending to existing table.
         
+        Uses COPY on PostgreSQL and multi-row INSERTs elsewhere.
+        
         Args:
             df: DataFrame to load
             table_name: Target table
@@ -113,14 +340,16 @@ class DatabaseLoader:
         Returns:
             Rows loaded
         """
+        if self._use_copy:
+            return self._load_copy(df, table_name, batch_size)
+        
         df.to_sql(
             name=table_name,
             con=self.engine,
             schema=self.schema,
             if_exists='append',
             index=False,
-            chunksize=batch_size,
-            method='multi'
+            chunksize=self._chunksize(df, batch_size)
         )
         
         return len(df)
@@ -129,11 +358,15 @@ class DatabaseLoader:
         self,
         df: pd.DataFrame,
         table_name: str,
-        batch_size: int
+        batch_size: int = DEFAULT_BATCH_SIZE
     ) -> int:
         """
         Load data by replacing existing table.
         
+        On PostgreSQL the empty table is recreated UNLOGGED, filled with
+        COPY, then switched back to LOGGED in one rewrite; elsewhere
+        multi-row INSERTs are used.
+        
         Args:
             df: DataFrame to load
             table_name: Target table
@@ -142,28 +375,383 @@ class DatabaseLoader:
         Returns:
             Rows loaded
         """
+        if self._use_copy:
+            return self._load_copy(
+                df, table_name, batch_size, if_exists='replace', unlogged=True
+            )
+        
         df.to_sql(
             name=table_name,
             con=self.engine,
             schema=self.schema,
             if_exists='replace',
             index=False,
-            chunksize=batch_size,
-            method='multi'
+            chunksize=self._chunksize(df, batch_size)
         )
         
         return len(df)
     
-    def _load_upsert(
+    def _load_copy(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        batch_size: int,
+        batch_id: Optional[str] = None,
+        if_exists: str = 'append',
+        binary: bool = True,
+        unlogged: bool = False
+    ) -> int:
+        """
+        Load data with PostgreSQL COPY FROM STDIN.
+        
+        Creates the table from the DataFrame schema if it does not exist
+        (or recreates it empty with if_exists='replace'), then streams
+        the rows through COPY, all inside one transaction.
+        With a batch_id, the ETL metadata columns are filled by column
+        defaults instead of being shipped with every row.
+        
+        Args:
+            df: DataFrame to load
+            table_name: Target table
+            batch_size: Rows per COPY batch
+            batch_id: Batch identifier for etl_batch_id
+            if_exists: 'append' or 'replace', as in DataFrame.to_sql
+            binary: Use binary COPY (pgcopy) for all-numeric/datetime
+                frames on psycopg2; text COPY otherwise
+            unlogged: Skip WAL during the COPY by making the table
+                UNLOGGED and restoring LOGGED afterwards; meant for
+                freshly (re)created tables
+            
+        Returns:
+            Rows loaded
+        """
+        # One transaction: if the COPY fails, the create/replace and the
+        # UNLOGGED switch roll back with it and the old table is kept
+        with self._begin_bulk() as conn:
+            # Create (or recreate) the empty table from the frame's schema
+            df.head(0).to_sql(
+                name=table_name,
+                con=conn,
+                schema=self.schema,
+                if_exists=if_exists,
+                index=False
+            )
+            
+            if batch_id is not None:
+                self.add_etl_metadata_columns(table_name, conn=conn)
+            
+            if unlogged:
+                self._set_logged(conn, table_name, False)
+            
+            self._copy_rows(conn, df, table_name, batch_size, batch_id, binary)
+            
+            if unlogged:
+                self._set_logged(conn, table_name, True)
+        
+        return len(df)
+    
+    def _copy_frame(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        batch_size: int,
+        batch_id: Optional[str] = None,
+        binary: bool = True
+    ) -> int:
+        """
+        COPY a frame into an existing table in one bulk transaction.
+        
+        Args:
+            df: DataFrame to load
+            table_name: Target table
+            batch_size: Rows per COPY batch
+            batch_id: Batch identifier for etl_batch_id
+            binary: Use binary COPY when the frame allows it
+            
+        Returns:
+            Rows loaded
+        """
+        with self._begin_bulk() as conn:
+            self._copy_rows(conn, df, table_name, batch_size, batch_id, binary)
+        
+        return len(df)
+    
+    def _copy_rows(
+        self,
+        conn: Connection,
+        df: pd.DataFrame,
+        table_name: str,
+        batch_size: int,
+        batch_id: Optional[str] = None,
+        binary: bool = True
+    ) -> None:
+        """
+        COPY a frame into an existing table on an open connection.
+        
+        Args:
+            conn: Open connection (caller manages the transaction)
+            df: DataFrame to load
+            table_name: Target table
+            batch_size: Rows per COPY batch
+            batch_id: Batch identifier for etl_batch_id
+            binary: Use binary COPY when the frame allows it
+        """
+        if batch_id is not None:
+            # Transaction-local; read by the etl_batch_id default
+            conn.execute(
+                text("SELECT set_config(:name, :value, true)"),
+                {'name': ETL_BATCH_ID_SETTING, 'value': batch_id}
+            )
+        
+        if binary and self._can_copy_binary(conn, df):
+            self._copy_binary(conn, df, table_name, batch_size)
+        else:
+            self._copy_from_stdin(conn, df, table_name, batch_size)
+    
+    def _load_partitioned(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        partition_by: str,
+        batch_size: int,
+        batch_id: Optional[str] = None
+    ) -> int:
+        """
+        COPY rows directly into monthly partitions, in parallel.
+        
+        Rows are grouped by the month of partition_by and each group is
+        COPYed into its {table_name}_YYYY_MM child on its own pooled
+        connection, bypassing tuple routing through the parent. Text
+        COPY is used since the children are not created from the frame
+        and the server must coerce values (e.g. timestamps into a date
+        key). Each partition commits independently: a failure leaves the other
+        months loaded, so reruns should target the failed batch.
+        
+        Args:
+            df: DataFrame to load
+            table_name: Partitioned parent table
+            partition_by: Date column the table is partitioned on
+            batch_size: Rows per COPY batch
+            batch_id: Batch identifier for etl_batch_id
+            
+        Returns:
+            Rows loaded
+        """
+        periods = pd.to_datetime(df[partition_by]).dt.to_period('M')
+        if periods.isna().any():
+            raise ValueError(f"Null values in partition column: {partition_by}")
+        
+        if batch_id is not None:
+            self.add_etl_metadata_columns(table_name)
+        
+        partitions = [
+            (f"{table_name}_{period.strftime('%Y_%m')}", group)
+            for period, group in df.groupby(periods, sort=True)
+        ]
+        if not partitions:
+            return 0
+        
+        logger.info(f"Loading {len(partitions)} partitions of {table_name}")
+        
+        def copy_partition(partition):
+            child_table, group = partition
+            return self._copy_frame(
+                group, child_table, batch_size, batch_id, binary=False
+            )
+        
+        workers = min(PARTITION_COPY_WORKERS, len(partitions))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return sum(executor.map(copy_partition, partitions))
+    
+    def _set_logged(self, conn: Connection, table_name: str, logged: bool) -> None:
+        """
+        Switch a PostgreSQL table between LOGGED and UNLOGGED.
+        
+        Args:
+            conn: Open connection (caller manages the transaction)
+            table_name: Table name
+            logged: True for LOGGED, False for UNLOGGED
+        """
+        mode = 'LOGGED' if logged else 'UNLOGGED'
+        
+        conn.execute(text(f"ALTER TABLE {self.schema}.{table_name} SET {mode}"))
+    
+    @contextmanager
+    def _begin_bulk(self) -> Iterator[Connection]:
+        """
+        Open a transaction tuned for bulk loading.
+        
+        On PostgreSQL the transaction commits with synchronous_commit
+        off, so COMMIT returns without waiting for the WAL flush, and
+        gets a larger work_mem for the ON CONFLICT merge. Both are SET
+        LOCAL and end with the transaction.
+        
+        Durability tradeoff: a server crash shortly after COMMIT can
+        lose the last committed loads (never corrupt them). Source data
+        is replayable, so a lost batch is re-run rather than recovered.
+        
+        Yields:
+            Connection inside the transaction
+        """
+        with self.engine.begin() as conn:
+            if self._use_copy:
+                conn.execute(text(
+                    f"SET LOCAL synchronous_commit = {BULK_SYNCHRONOUS_COMMIT}"
+                ))
+                conn.execute(text(f"SET LOCAL work_mem = '{BULK_WORK_MEM}'"))
+            
+            yield conn
+    
+    @staticmethod
+    def _can_copy_binary(conn: Connection, df: pd.DataFrame) -> bool:
+        """
+        Check whether a frame can be loaded with binary COPY.
+        
+        Requires pgcopy, the psycopg2 driver, and only numeric, boolean
+        or datetime columns (text gains nothing from binary format).
+        
+        Args:
+            conn: Open connection
+            df: DataFrame to load
+            
+        Returns:
+            True if binary COPY applies
+        """
+        if CopyManager is None or conn.dialect.driver != 'psycopg2':
+            return False
+        
+        return all(
+            pd.api.types.is_numeric_dtype(dtype)
+            or pd.api.types.is_datetime64_any_dtype(dtype)
+            for dtype in df.dtypes
+        )
+    
+    def _copy_binary(
         self,
+        conn: Connection,
+        df: pd.DataFrame,
+        table_name: str,
+        batch_size: int
+    ) -> None:
+        """
+        Copy a DataFrame into a table with binary COPY via pgcopy.
+        
+        Args:
+            conn: Open connection (caller manages the transaction)
+            df: DataFrame to copy
+            table_name: Target table
+            batch_size: Rows serialized per COPY
+        """
+        manager = CopyManager(
+            conn.connection.dbapi_connection,
+            f"{self.schema}.{table_name}",
+            df.columns.tolist()
+        )
+        
+        for start in range(0, len(df), batch_size):
+            batch = df.iloc[start:start + batch_size].astype(object)
+            records = batch.where(batch.notna(), None).itertuples(
+                index=False, name=None
+            )
+            manager.copy(records, io.BytesIO)
+    
+    def _copy_from_stdin(
+        self,
+        conn: Connection,
         df: pd.DataFrame,
         table_name: str,
         batch_size: int,
+        schema: Optional[str] = None
+    ) -> None:
+        """
+        Copy a DataFrame into a table with a single COPY FROM STDIN.
+        
+        Rows are serialized batch by batch while the server consumes
+        them, so the whole frame is never held as one text buffer.
+        
+        Args:
+            conn: Open connection (caller manages the transaction)
+            df: DataFrame to copy
+            table_name: Target table
+            batch_size: Rows serialized per chunk
+            schema: Schema of the target table (default: loader schema)
+        """
+        schema = schema or self.schema
+        quote = conn.dialect.identifier_preparer.quote
+        columns = ', '.join(quote(col) for col in df.columns)
+        
+        chunks = self._iter_csv_chunks(df, batch_size)
+        
+        copy_sql = (
+            f"COPY {schema}.{table_name} ({columns}) "
+            f"FROM STDIN WITH (FORMAT text, NULL '{COPY_NULL}')"
+        )
+        
+        cursor = conn.connection.cursor()
+        try:
+            if hasattr(cursor, 'copy_expert'):
+                # psycopg2
+                cursor.copy_expert(copy_sql, _ChunkStream(chunks))
+            else:
+                # psycopg 3
+                with cursor.copy(copy_sql) as copy:
+                    for chunk in chunks:
+                        copy.write(chunk)
+        finally:
+            cursor.close()
+    
+    @staticmethod
+    def _iter_csv_chunks(df: pd.DataFrame, batch_size: int) -> Iterator[str]:
+        """
+        Serialize a DataFrame to COPY text format, one batch at a time.
+        
+        Tab-separated, NULL as \\N, with backslash, newline, carriage
+        return and tab escaped in string and category columns.
+        
+        Args:
+            df: DataFrame to serialize
+            batch_size: Rows per chunk
+            
+        Yields:
+            COPY text for each batch
+        """
+        text_columns = df.select_dtypes(
+            include=['object', 'string', 'category']
+        ).columns
+        
+        for start in range(0, len(df), batch_size):
+            batch = df.iloc[start:start + batch_size]
+            
+            if len(text_columns):
+                batch = batch.copy()
+                for col in text_columns:
+                    batch[col] = _escape_copy_column(batch[col])
+            
+            yield batch.to_csv(
+                sep='\t',
+                index=False,
+                header=False,
+                na_rep=COPY_NULL,
+                quoting=csv.QUOTE_NONE,
+                lineterminator='\n'
+            )
+    
+    def _load_upsert(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
         key_columns: Optional[List[str]] = None
     ) -> int:
         """
         Load data with upsert (insert or update).
         
+        On PostgreSQL the rows are staged with COPY into a temporary
+        table shaped like the target, and merged with INSERT ... ON
+        CONFLICT in the same transaction. When the frame carries every
+        target column in table order the merge is a plain SELECT *,
+        without a projection over the staging table.
+        
         Args:
             df: DataFrame to load
             table_name: Target table
@@ -176,38 +764,216 @@ class DatabaseLoader:
         if key_columns is None:
             key_columns = [df.columns[0]]
         
-        # Create temporary table
         temp_table = f"{table_name}_temp"
-        df.to_sql(
-            name=temp_table,
-            con=self.engine,
-            schema=self.schema,
-            if_exists='replace',
-            index=False
-        )
+        
+        if self._use_copy:
+            # Session-local staging table, dropped at commit
+            staging_table = f"pg_temp.{temp_table}"
+        else:
+            staging_table = f"{self.schema}.{temp_table}"
+            df.to_sql(
+                name=temp_table,
+                con=self.engine,
+                schema=self.schema,
+                if_exists='replace',
+                index=False,
+                chunksize=self._chunksize(df, UPSERT_STAGING_CHUNK_SIZE)
+            )
         
         # Build upsert query
         columns = df.columns.tolist()
         set_clause = ', '.join([f"{col} = EXCLUDED.{col}" for col in columns if col not in key_columns])
         
-        upsert_query = f"""
-        INSERT INTO {self.schema}.{table_name} ({', '.join(columns)})
-        SELECT {', '.join(columns)}
-        FROM {self.schema}.{temp_table}
-        ON CONFLICT ({', '.join(key_columns)})
-        DO UPDATE SET {set_clause}
+        with self._begin_bulk() as conn:
+            if self._use_copy:
+                conn.execute(text(
+                    f"CREATE TEMPORARY TABLE {temp_table} "
+                    f"(LIKE {self.schema}.{table_name} INCLUDING DEFAULTS) "
+                    f"ON COMMIT DROP"
+                ))
+                self._copy_from_stdin(
+                    conn, df, temp_table, batch_size, schema='pg_temp'
+                )
+                
+                # Fresh statistics so the planner sizes the join correctly
+                conn.execute(text(f"ANALYZE {staging_table}"))
+            
+            if columns == self._table_columns(conn, table_name):
+                insert_clause = f"INSERT INTO {self.schema}.{table_name}"
+                select_clause = "SELECT *"
+            else:
+                insert_clause = (
+                    f"INSERT INTO {self.schema}.{table_name} ({', '.join(columns)})"
+                )
+                select_clause = f"SELECT {', '.join(columns)}"
+            
+            upsert_query = f"""
+            {insert_clause}
+            {select_clause}
+            FROM {staging_table}
+            ON CONFLICT ({', '.join(key_columns)})
+            DO UPDATE SET {set_clause}
+            """
+            
+            result = conn.execute(text(upsert_query))
+            
+            if not self._use_copy:
+                conn.execute(text(f"DROP TABLE {staging_table}"))
+        
+        return len(df)
+    
+    def _table_columns(self, conn: Connection, table_name: str) -> List[str]:
         """
+        Get a table's column names in table order.
+        
+        Args:
+            conn: Open connection
+            table_name: Table name
+            
+        Returns:
+            Column names
+        """
+        result = conn.execute(
+            text(f"SELECT * FROM {self.schema}.{table_name} WHERE 1 = 0")
+        )
+        return list(result.keys())
+    
+    @staticmethod
+    def _chunksize(df: pd.DataFrame, batch_size: int) -> Optional[int]:
+        """
+        Get the to_sql chunksize for a frame.
+        
+        Frames smaller than one batch are written in a single call.
+        
+        Args:
+            df: DataFrame to load
+            batch_size: Requested rows per chunk
+            
+        Returns:
+            Chunk size, or None for a single chunk
+        """
+        return None if len(df) < batch_size else batch_size
+    
+    def add_etl_metadata_columns(
+        self,
+        table_name: str,
+        conn: Optional[Connection] = None
+    ) -> None:
+        """
+        Add server-side ETL metadata columns to a table and set defaults.
+        
+        etl_loaded_at defaults to the transaction timestamp and
+        etl_batch_id to the transaction-local 'etl.batch_id' setting, so
+        both are constant per load without being sent per row. Defaults
+        are (re)installed on columns that already exist, e.g. ones
+        created by earlier to_sql loads; on partitioned tables they
+        cascade to every partition.
+        
+        Args:
+            table_name: Table name
+            conn: Connection to run on inside its transaction (default:
+                a transaction of its own)
+        """
+        clauses = []
+        for column, column_type, default in ETL_METADATA_COLUMNS:
+            clauses.append(f"ADD COLUMN IF NOT EXISTS {column} {column_type}")
+            clauses.append(f"ALTER COLUMN {column} SET DEFAULT {default}")
+        
+        query = (
+            f"ALTER TABLE {self.schema}.{table_name} " + ", ".join(clauses)
+        )
+        
+        if conn is not None:
+            conn.execute(text(query))
+            return
         
         with self.engine.begin() as conn:
-            result = conn.execute(text(upsert_query))
-            conn.execute(text(f"DROP TABLE {self.schema}.{temp_table}"))
+            conn.execute(text(query))
+    
+    def _snapshot_and_drop_indexes(self, table_name: str) -> List[str]:
+        """
+        Drop a table's secondary indexes, returning DDL to rebuild them.
         
-        return len(df)
+        Unique indexes and indexes backing constraints are kept, so the
+        load still enforces uniqueness and the rebuild cannot fail.
+        
+        Args:
+            table_name: Table name
+            
+        Returns:
+            CREATE INDEX statements for the dropped indexes
+        """
+        query = """
+        SELECT i.indexrelid::regclass::text AS index_name,
+               pg_get_indexdef(i.indexrelid) AS index_def
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = :schema
+          AND c.relname = :table_name
+          AND NOT i.indisunique
+          AND NOT EXISTS (
+              SELECT 1 FROM pg_constraint con
+              WHERE con.conindid = i.indexrelid
+          )
+        """
+        
+        with self.engine.begin() as conn:
+            indexes = conn.execute(
+                text(query),
+                {'schema': self.schema, 'table_name': table_name}
+            ).fetchall()
+            
+            for index_name, _ in indexes:
+                conn.execute(text(f"DROP INDEX {index_name}"))
+        
+        if indexes:
+            logger.info(
+                f"Dropped {len(indexes)} indexes on "
+                f"{self.schema}.{table_name} for load"
+            )
+        
+        return [index_def for _, index_def in indexes]
+    
+    def _recreate_indexes(self, index_defs: List[str]) -> None:
+        """
+        Rebuild indexes dropped by _snapshot_and_drop_indexes.
+        
+        Args:
+            index_defs: CREATE INDEX statements
+        """
+        with self.engine.begin() as conn:
+            self._configure_index_build(conn)
+            for index_def in index_defs:
+                conn.execute(text(index_def))
+        
+        logger.info(f"Recreated {len(index_defs)} indexes")
+    
+    def _configure_index_build(self, conn: Connection, local: bool = True) -> None:
+        """
+        Raise maintenance limits so PostgreSQL builds B-trees in parallel.
+        
+        Args:
+            conn: Open connection
+            local: Scope settings to the current transaction (SET LOCAL);
+                otherwise they last for the session until RESET
+        """
+        if not self._use_copy:
+            return
+        
+        scope = 'LOCAL ' if local else ''
+        conn.execute(text(
+            f"SET {scope}max_parallel_maintenance_workers = {INDEX_BUILD_WORKERS}"
+        ))
+        conn.execute(text(
+            f"SET {scope}maintenance_work_mem = '{INDEX_BUILD_WORK_MEM}'"
+        ))
     
     def _create_indexes(
         self,
         table_name: str,
-        columns: List[str]
+        columns: List[str],
+        concurrent: bool = False
     ) -> None:
         """
         Create indexes on specified columns.
@@ -215,17 +981,38 @@ class DatabaseLoader:
         Args:
             table_name: Table name
             columns: Columns to index
+            concurrent: Use CREATE INDEX CONCURRENTLY (runs outside a
+                transaction and does not block writers)
         """
         logger.info(f"Creating indexes on {columns}")
         
-        with self.engine.begin() as conn:
-            for col in columns:
-                index_name = f"idx_{table_name}_{col}"
-                query = f"""
-                CREATE INDEX IF NOT EXISTS {index_name}
-                ON {self.schema}.{table_name} ({col})
-                """
-                conn.execute(text(query))
+        concurrently = 'CONCURRENTLY ' if concurrent else ''
+        queries = []
+        for col in columns:
+            index_name = f"idx_{table_name}_{col}"
+            queries.append(f"""
+            CREATE INDEX {concurrently}IF NOT EXISTS {index_name}
+            ON {self.schema}.{table_name} ({col})
+            """)
+        
+        if concurrent:
+            # CONCURRENTLY cannot run inside a transaction block
+            with self.engine.connect().execution_options(
+                isolation_level='AUTOCOMMIT'
+            ) as conn:
+                self._configure_index_build(conn, local=False)
+                try:
+                    for query in queries:
+                        conn.execute(text(query))
+                finally:
+                    if self._use_copy:
+                        conn.execute(text("RESET max_parallel_maintenance_workers"))
+                        conn.execute(text("RESET maintenance_work_mem"))
+        else:
+            with self.engine.begin() as conn:
+                self._configure_index_build(conn)
+                for query in queries:
+                    conn.execute(text(query))
         
         logger.info("Indexes created successfully")
     
@@ -239,8 +1026,36 @@ class DatabaseLoader:
         Returns:
             True if table exists
         """
-        inspector = inspect(self.engine)
-        return table_name in inspector.get_table_names(schema=self.schema)
+        return table_name in self._get_table_names()
+    
+    def _get_table_names(self) -> set:
+        """
+        Get table names in the schema, cached for TABLE_NAMES_CACHE_TTL.
+        
+        Returns:
+            Set of table names
+        """
+        now = time.monotonic()
+        
+        if (
+            self._table_names is None
+            or now - self._table_names_fetched_at > TABLE_NAMES_CACHE_TTL
+        ):
+            if self._inspector is None:
+                self._inspector = inspect(self.engine)
+            else:
+                self._inspector.clear_cache()
+            
+            self._table_names = set(
+                self._inspector.get_table_names(schema=self.schema)
+            )
+            self._table_names_fetched_at = now
+        
+        return self._table_names
+    
+    def _invalidate_table_cache(self) -> None:
+        """Forget cached reflection after DDL issued by this loader."""
+        self._table_names = None
     
     def get_table_row_count(self, table_name: str) -> int:
         """
@@ -323,22 +1138,31 @@ class DatabaseLoader:
                     )
                 )
         
+        self._invalidate_table_cache()
         logger.info("Table created successfully")
     
     def get_last_updated(
         self,
         table_name: str,
         date_column: str
-    ) -> Optional[pd.Timestamp]:
+    ) -> Any:
         """
         Get the latest date from a table.
         
+        One query, no table-listing cache: a missing table or column is
+        recognized from the error PostgreSQL raises; other database
+        errors are not swallowed.
+        
         Args:
             table_name: Table name
             date_column: Date column to check
             
         Returns:
-            Latest timestamp or None
+            Latest value of date_column as returned by the driver, or
+            None if the table is missing or empty
+            
+        Raises:
+            ValueError: If date_column is not a column of the table
         """
         query = f"""
         SELECT MAX({date_column}) as max_date
@@ -346,10 +1170,18 @@ class DatabaseLoader:
         """
         
         try:
-            result = pd.read_sql(query, self.engine)
-            return result['max_date'].iloc[0]
-        except:
-            return None
+            with self.engine.connect() as conn:
+                return conn.execute(text(query)).scalar()
+        except ProgrammingError as e:
+            # psycopg 3 exposes sqlstate, psycopg2 pgcode
+            sqlstate = getattr(e.orig, 'sqlstate', None) or getattr(e.orig, 'pgcode', None)
+            if sqlstate in PG_UNDEFINED_RELATION:
+                return None
+            if sqlstate == PG_UNDEFINED_COLUMN:
+                raise ValueError(
+                    f"Unknown column {date_column} in {self.schema}.{table_name}"
+                ) from e
+            raise
 
 
 # Example usage
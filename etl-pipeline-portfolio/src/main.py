@@ -4,21 +4,59 @@ Coordinates Extract, Transform, and Load processes.
 """
 
 import sys
+import os
 import logging
+import multiprocessing
+import queue
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent))
 
 from extract.api_extractor import APIExtractor
-from extract.csv_extractor import CSVExtractor
+from extract.csv_extractor import CSVExtractor, DEFAULT_CHUNK_SIZE
 from transform.transformer import DataTransformer
 from load.db_loader import DatabaseLoader
 from utils.config import Config
 from utils.logger import setup_logger
 
+logger = logging.getLogger(__name__)
+
+DUMP_FORMATS = ('parquet', 'csv')
+
+
+# Chunks buffered per CSV producer process before producers block
+PRODUCER_QUEUE_DEPTH = 2
+
+# Seconds between liveness checks while waiting on CSV producers
+PRODUCER_POLL_INTERVAL = 1.0
+
+
+def _produce_chunks(chunk_queue, index: int, file_path: str, chunk_size: int) -> None:
+    """
+    Parse one CSV file in a producer process, queueing its chunks.
+    
+    Puts (index, 'chunk', df) per chunk, (index, 'error', msg) on
+    failure and always a final (index, 'done', None).
+    
+    Args:
+        chunk_queue: multiprocessing.Queue read by ETLPipeline.extract_iter
+        index: Position of the file in the configured list
+        file_path: Path to CSV file
+        chunk_size: Rows per chunk
+    """
+    try:
+        for chunk in CSVExtractor().extract_chunks(file_path, chunk_size=chunk_size):
+            chunk['source'] = 'csv'
+            chunk['source_file'] = Path(file_path).name
+            chunk_queue.put((index, 'chunk', chunk))
+    except Exception as e:
+        chunk_queue.put((index, 'error', str(e)))
+    finally:
+        chunk_queue.put((index, 'done', None))
+
 
 class ETLPipeline:
     """
@@ -30,14 +68,26 @@ class ETLPipeline:
     3. Load into data warehouse
     """
     
-    def __init__(self, config_path: str = 'config/pipeline.yaml'):
+    def __init__(
+        self,
+        config_path: str = 'config/pipeline.yaml',
+        dump_format: str = 'parquet'
+    ):
         """
         Initialize ETL Pipeline.
         
         Args:
             config_path: Path to configuration file
+            dump_format: Format of intermediate dumps ('parquet' or 'csv'),
+                written only when debug.persist_intermediate is enabled
         """
+        if dump_format not in DUMP_FORMATS:
+            raise ValueError(f"Unknown dump format: {dump_format}")
+        
         self.config = Config(config_path)
+        self.dump_format = dump_format
+        self.batch_id = datetime.now().strftime('%Y%m%d%H%M%S')
+        self._loader = None
         self.logger = setup_logger(
             name='ETLPipeline',
             log_file=f'data/logs/etl_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
@@ -51,6 +101,9 @@ class ETLPipeline:
         """
         Run complete ETL pipeline.
         
+        Data is streamed chunk by chunk through extract, transform and
+        load, so memory stays bounded by the chunk size.
+        
         Args:
             source: Specific source to process (None for all)
             
@@ -61,21 +114,54 @@ class ETLPipeline:
             start_time = datetime.now()
             self.logger.info(f"Pipeline start time: {start_time}")
             
-            # Extract
-            self.logger.info("STEP 1: EXTRACT")
-            raw_data = self.extract(source)
+            self.logger.info("STREAMING: EXTRACT -> TRANSFORM -> LOAD")
+            strategy = self.config.get('load.database.strategy', 'append')
+            chunks = 0
             
-            if raw_data is None or raw_data.empty:
-                self.logger.warning("No data extracted. Aborting pipeline.")
-                return False
+            # One transformer per stream (CSV file or API) so duplicates are
+            # caught across its chunks and every chunk is cleaned with the
+            # stream's first-chunk decisions, whatever order streams arrive in
+            transformers = {}
+            rows_processed = 0
+            rows_loaded = 0
+            columns = []
             
-            # Transform
-            self.logger.info("STEP 2: TRANSFORM")
-            transformed_data = self.transform(raw_data)
+            for chunk in self.extract_iter(source):
+                if chunk.empty:
+                    continue
+                
+                stream = chunk.attrs.get('stream')
+                if stream not in transformers:
+                    transformers[stream] = DataTransformer(
+                        dedup_across_calls=True,
+                        fit_once=True
+                    )
+                
+                transformed = self.transform(
+                    chunk, part=chunks, transformer=transformers[stream]
+                )
+                
+                # The first chunk creates the target table; later chunks may
+                # leave columns out (loaded as NULL) but cannot add new ones
+                extra = transformed.columns.difference(columns).tolist()
+                if columns and extra:
+                    raise ValueError(
+                        f"Chunk from {stream} has columns not in the target "
+                        f"table: {extra}"
+                    )
+                columns.extend(extra)
+                
+                rows_loaded += self.load(transformed, strategy=strategy)
+                rows_processed += len(transformed)
+                chunks += 1
+                
+                # Later chunks add to the table the first chunk replaced
+                if strategy == 'replace':
+                    strategy = 'append'
             
-            # Load
-            self.logger.info("STEP 3: LOAD")
-            rows_loaded = self.load(transformed_data)
+            if chunks == 0:
+                self.logger.warning("No data extracted. Aborting pipeline.")
+                return False
             
             # Summary
             end_time = datetime.now()
@@ -84,7 +170,8 @@ class ETLPipeline:
             self.logger.info("=" * 80)
             self.logger.info("PIPELINE SUMMARY")
             self.logger.info(f"Status: SUCCESS")
-            self.logger.info(f"Rows Processed: {len(transformed_data)}")
+            self.logger.info(f"Chunks Processed: {chunks}")
+            self.logger.info(f"Rows Processed: {rows_processed}")
             self.logger.info(f"Rows Loaded: {rows_loaded}")
             self.logger.info(f"Duration: {duration:.2f} seconds")
             self.logger.info("=" * 80)
@@ -95,37 +182,85 @@ class ETLPipeline:
             self.logger.error(f"Pipeline failed: {str(e)}", exc_info=True)
             return False
     
-    def extract(self, source: Optional[str] = None):
+    def extract_iter(self, source: Optional[str] = None) -> Iterator:
         """
-        Extract data from configured sources.
+        Extract data from configured sources as a stream of chunks.
+        
+        CSV files are read in chunks of extract.csv.chunk_size rows; the
+        API response is yielded as a single chunk.
         
         Args:
             source: Specific source to extract (None for all)
             
-        Returns:
-            Extracted data as DataFrame
+        Yields:
+            Extracted DataFrame chunks
         """
         import pandas as pd
         
-        all_data = []
+        part = 0
         
         # Extract from CSV
         if source in [None, 'csv']:
-            try:
-                self.logger.info("Extracting from CSV files...")
-                csv_extractor = CSVExtractor()
-                
-                csv_files = self.config.get('extract.csv.files', [])
-                for file_path in csv_files:
-                    df = csv_extractor.extract(file_path)
-                    df['source'] = 'csv'
-                    df['source_file'] = Path(file_path).name
-                    all_data.append(df)
-                
-                self.logger.info(f"CSV extraction completed: {len(csv_files)} files")
+            self.logger.info("Extracting from CSV files...")
+            
+            csv_files = self.config.get('extract.csv.files', [])
+            chunk_size = self.config.get('extract.csv.chunk_size', DEFAULT_CHUNK_SIZE)
+            
+            if csv_files:
+                # Parse files in parallel processes (CPU-bound), one producer
+                # per file; chunks are yielded as they arrive and the bounded
+                # queue applies backpressure to the producers
+                processes = min(len(csv_files), os.cpu_count() or 1)
+                chunk_queue = multiprocessing.Queue(
+                    maxsize=processes * PRODUCER_QUEUE_DEPTH
+                )
+                waiting = list(enumerate(csv_files))
+                running = {}
                 
-            except Exception as e:
-                self.logger.error(f"CSV extraction failed: {e}")
+                try:
+                    while waiting or running:
+                        while waiting and len(running) < processes:
+                            index, file_path = waiting.pop(0)
+                            producer = multiprocessing.Process(
+                                target=_produce_chunks,
+                                args=(chunk_queue, index, file_path, chunk_size),
+                                daemon=True
+                            )
+                            producer.start()
+                            running[index] = producer
+                        
+                        try:
+                            index, kind, payload = chunk_queue.get(
+                                timeout=PRODUCER_POLL_INTERVAL
+                            )
+                        except queue.Empty:
+                            # A killed producer never sends 'done'
+                            for index, producer in running.items():
+                                if producer.exitcode not in (None, 0):
+                                    raise RuntimeError(
+                                        f"CSV producer for {csv_files[index]} died "
+                                        f"(exit code {producer.exitcode})"
+                                    )
+                            continue
+                        
+                        if kind == 'chunk':
+                            payload.attrs['stream'] = csv_files[index]
+                            self._persist_intermediate(payload, 'data/raw/raw_data', part)
+                            part += 1
+                            yield payload
+                        elif kind == 'error':
+                            self.logger.error(
+                                f"CSV extraction failed for {csv_files[index]}: {payload}"
+                            )
+                        else:
+                            running.pop(index).join()
+                finally:
+                    # Consumer stopped early or failed: don't leave producers
+                    # blocked on the queue
+                    for producer in running.values():
+                        producer.terminate()
+            
+            self.logger.info(f"CSV extraction completed: {len(csv_files)} files")
         
         # Extract from API
         if source in [None, 'api']:
@@ -144,38 +279,61 @@ class ETLPipeline:
                 data = api_extractor.extract(endpoint, params)
                 df = pd.DataFrame(data)
                 df['source'] = 'api'
-                all_data.append(df)
+                df.attrs['stream'] = 'api'
+                
+                # Source guarantees unique records: let clean() skip dedup
+                if api_config.get('unique_records', False):
+                    df.attrs['deduplicated'] = True
                 
                 self.logger.info(f"API extraction completed: {len(df)} records")
                 
             except Exception as e:
                 self.logger.error(f"API extraction failed: {e}")
+            else:
+                self._persist_intermediate(df, 'data/raw/raw_data', part)
+                yield df
+    
+    def extract(self, source: Optional[str] = None):
+        """
+        Extract data from configured sources.
+        
+        Args:
+            source: Specific source to extract (None for all)
+            
+        Returns:
+            Extracted data as DataFrame
+        """
+        import pandas as pd
+        
+        all_data = list(self.extract_iter(source))
         
         # Combine all data
         if all_data:
             combined_df = pd.concat(all_data, ignore_index=True)
             self.logger.info(f"Total records extracted: {len(combined_df)}")
-            
-            # Save raw data
-            raw_path = f"data/raw/raw_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            combined_df.to_csv(raw_path, index=False)
-            self.logger.info(f"Raw data saved to: {raw_path}")
-            
             return combined_df
         else:
             return None
     
-    def transform(self, df):
+    def transform(
+        self,
+        df,
+        part: Optional[int] = None,
+        transformer: Optional[DataTransformer] = None
+    ):
         """
         Transform and clean data.
         
         Args:
             df: Input DataFrame
+            part: Chunk number when streaming (used to name dumps)
+            transformer: Transformer carrying state across chunks
+                (default: a fresh one)
             
         Returns:
             Transformed DataFrame
         """
-        transformer = DataTransformer()
+        transformer = transformer or DataTransformer()
         
         # Clean data
         self.logger.info("Cleaning data...")
@@ -201,44 +359,82 @@ class ETLPipeline:
         
         # Add metadata columns
         df['etl_loaded_at'] = datetime.now()
-        df['etl_batch_id'] = datetime.now().strftime('%Y%m%d%H%M%S')
+        df['etl_batch_id'] = self.batch_id
         
         self.logger.info(f"Transformation completed: {len(df)} rows")
         
         # Save processed data
-        processed_path = f"data/processed/processed_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        df.to_csv(processed_path, index=False)
-        self.logger.info(f"Processed data saved to: {processed_path}")
+        self._persist_intermediate(df, 'data/processed/processed_data', part)
         
         return df
     
-    def load(self, df):
+    def _persist_intermediate(
+        self,
+        df,
+        path_prefix: str,
+        part: Optional[int] = None
+    ) -> None:
+        """
+        Dump an intermediate frame when debug.persist_intermediate is set.
+        
+        Args:
+            df: DataFrame to save
+            path_prefix: Output path without timestamp and extension
+            part: Chunk number appended to the file name when streaming
+        """
+        if not self.config.get('debug.persist_intermediate', False):
+            return
+        
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        suffix = f"_part{part:05d}" if part is not None else ''
+        path = f"{path_prefix}_{timestamp}{suffix}.{self.dump_format}"
+        
+        if self.dump_format == 'parquet':
+            df.to_parquet(
+                path,
+                engine='pyarrow',
+                compression='zstd',
+                use_dictionary=True,
+                index=False
+            )
+        else:
+            df.to_csv(path, index=False)
+        
+        self.logger.info(f"Intermediate data saved to: {path}")
+    
+    def load(self, df, strategy: Optional[str] = None):
         """
         Load data into database.
         
         Args:
             df: DataFrame to load
+            strategy: Load strategy (default: load.database.strategy)
             
         Returns:
             Number of rows loaded
         """
         db_config = self.config.get('load.database', {})
         
-        loader = DatabaseLoader(
-            connection_string=db_config.get('connection_string'),
-            schema=db_config.get('schema', 'public')
-        )
+        # One loader (and connection pool) shared by all chunks
+        if self._loader is None:
+            self._loader = DatabaseLoader(
+                connection_string=db_config.get('connection_string'),
+                schema=db_config.get('schema', 'public')
+            )
+        loader = self._loader
         
         table_name = db_config.get('table_name', 'etl_data')
-        strategy = db_config.get('strategy', 'append')
+        strategy = strategy or db_config.get('strategy', 'append')
         
         self.logger.info(f"Loading to table: {table_name}")
         
+        # Chunks arrive one by one; rebuilding indexes after each would
+        # rescan the whole table every time
         rows_loaded = loader.load(
             df,
             table_name=table_name,
             strategy=strategy,
-            batch_size=1000
+            drop_indexes_during_load=False
         )
         
         self.logger.info(f"Load completed: {rows_loaded} rows")
@@ -262,11 +458,20 @@ def main():
         default='config/pipeline.yaml',
         help='Path to configuration file'
     )
+    parser.add_argument(
+        '--dump-format',
+        choices=DUMP_FORMATS,
+        default='parquet',
+        help='Format of intermediate dumps (debug.persist_intermediate)'
+    )
     
     args = parser.parse_args()
     
     # Run pipeline
-    pipeline = ETLPipeline(config_path=args.config)
+    pipeline = ETLPipeline(
+        config_path=args.config,
+        dump_format=args.dump_format
+    )
     source = None if args.source == 'all' else args.source
     
     success = pipeline.run(source=source)
@@ -5,12 +5,19 @@ Applies cleaning, validation, and transformations to data.
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import logging
-from typing import List, Dict, Optional, Callable
+from typing import Any, List, Dict, Optional, Callable
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+SUPPORTED_BACKENDS = ('pandas', 'polars')
+
+# PyArrow-backed targets for convert_types
+ARROW_INT64 = pd.ArrowDtype(pa.int64())
+ARROW_CATEGORY = pd.ArrowDtype(pa.dictionary(pa.int32(), pa.string()))
+
 
 class DataTransformer:
     """
@@ -24,8 +31,31 @@ class DataTransformer:
     - Data validation
     """
     
-    def __init__(self):
-        """Initialize Data Transformer."""
+    def __init__(
+        self,
+        dedup_across_calls: bool = False,
+        fit_once: bool = False
+    ):
+        """
+        Initialize Data Transformer.
+        
+        Args:
+            dedup_across_calls: Remember row hashes between clean() calls
+                so duplicates spanning streamed chunks are also removed
+            fit_once: Decide dropped columns and fill values on the first
+                clean() call and reuse them, so streamed chunks come out
+                with the same columns and consistent fills
+        """
+        self.dedup_across_calls = dedup_across_calls
+        self.fit_once = fit_once
+        
+        # Null handling fitted on the first chunk (fit_once)
+        self._dropped_columns: Optional[List[str]] = None
+        self._fill_values: Dict[str, Any] = {}
+        
+        # Sorted uint64 hashes of rows kept so far (dedup_across_calls)
+        self._seen_hashes = np.empty(0, dtype=np.uint64)
+        
         logger.info("DataTransformer initialized")
     
     def clean(
@@ -33,71 +63,270 @@ class DataTransformer:
         df: pd.DataFrame,
         remove_duplicates: bool = True,
         handle_nulls: str = 'drop',
-        null_threshold: float = 0.5
+        null_threshold: float = 0.5,
+        backend: str = 'pandas'
     ) -> pd.DataFrame:
         """
         Clean DataFrame.
         
+        Deduplication is skipped for frames tagged with
+        ``df.attrs['deduplicated'] = True`` by their source.
+        
         Args:
             df: Input DataFrame
             remove_duplicates: Remove duplicate rows
             handle_nulls: How to handle nulls ('drop', 'fill', 'keep')
             null_threshold: Max proportion of nulls allowed per column
+            backend: Engine for deduplication and null handling
+                ('pandas' or 'polars')
             
         Returns:
             Cleaned DataFrame
         """
+        if backend not in SUPPORTED_BACKENDS:
+            raise ValueError(
+                f"Unsupported backend: {backend}. "
+                f"Choose from {SUPPORTED_BACKENDS}"
+            )
+        
+        if df.attrs.get('deduplicated'):
+            remove_duplicates = False
+        
+        if backend == 'polars':
+            return self._clean_polars(
+                df, remove_duplicates, handle_nulls, null_threshold
+            )
+        
         logger.info("Starting data cleaning")
         initial_rows = len(df)
         
         # Remove duplicates
         if remove_duplicates:
-            df = df.drop_duplicates()
+            if self.dedup_across_calls:
+                df = df[self._unseen_rows(df)]
+            else:
+                df = df.drop_duplicates()
+            logger.info(f"Removed {initial_rows - len(df)} duplicate rows")
+        
+        # Handle columns with too many nulls (one null-mask pass, reused below)
+        null_mask = df.isnull()
+        null_counts = null_mask.sum()
+        cols_to_drop = self._columns_to_drop(null_counts / len(df), null_threshold)
+        
+        if cols_to_drop:
+            logger.warning(f"Dropping columns with >{null_threshold:.0%} nulls: {cols_to_drop}")
+            df = df.drop(columns=cols_to_drop)
+            null_mask = null_mask.drop(columns=cols_to_drop)
+            null_counts = null_counts.drop(cols_to_drop)
+        
+        # Handle remaining nulls
+        if handle_nulls == 'drop':
+            df = df[~null_mask.any(axis=1)]
+            logger.info(f"Dropped rows with nulls. Remaining: {len(df)}")
+        elif handle_nulls == 'fill':
+            df = self._fill_nulls(df, null_counts)
+        
+        logger.info(f"Cleaning completed. Final rows: {len(df)}")
+        return df
+    
+    def _unseen_rows(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Mark rows not seen before in this frame or in earlier calls.
+        
+        Rows are compared by their 64-bit content hash, which keeps the
+        memory cost at 8 bytes per distinct row. Matches are not
+        confirmed against row values: two distinct rows collide with
+        probability about n**2 / 2**65 for n distinct rows (~3e-4 at
+        100M rows), in which case the later row is dropped.
+        
+        Args:
+            df: Input DataFrame
+            
+        Returns:
+            Boolean mask of the rows to keep (the kept rows are recorded)
+        """
+        hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        seen = self._seen_hashes
+        
+        keep = ~pd.Series(hashes).duplicated().to_numpy()
+        if len(seen):
+            # Binary search in the sorted history: O(n log N) per chunk
+            pos = np.minimum(np.searchsorted(seen, hashes), len(seen) - 1)
+            keep &= seen[pos] != hashes
+        
+        # Merge in only the new hashes, keeping the history sorted
+        new_hashes = np.sort(hashes[keep])
+        self._seen_hashes = np.insert(
+            seen, np.searchsorted(seen, new_hashes), new_hashes
+        )
+        
+        return keep
+    
+    def _clean_polars(
+        self,
+        df: pd.DataFrame,
+        remove_duplicates: bool,
+        handle_nulls: str,
+        null_threshold: float
+    ) -> pd.DataFrame:
+        """
+        Clean DataFrame with Polars (multi-threaded dedup and null counts).
+        
+        Polars only computes row masks and null counts; rows are then
+        selected from the pandas frame, so the result keeps the original
+        index and dtypes exactly like the pandas path.
+        
+        Args:
+            df: Input DataFrame
+            remove_duplicates: Remove duplicate rows
+            handle_nulls: How to handle nulls ('drop', 'fill', 'keep')
+            null_threshold: Max proportion of nulls allowed per column
+            
+        Returns:
+            Cleaned DataFrame
+        """
+        import polars as pl
+        
+        logger.info("Starting data cleaning (polars)")
+        initial_rows = len(df)
+        
+        pdf = pl.from_pandas(df)
+        
+        # Remove duplicates (first occurrence kept, order preserved)
+        if remove_duplicates:
+            if self.dedup_across_calls:
+                keep = self._unseen_rows(df)
+            else:
+                keep = pdf.select(
+                    pl.struct(pl.all()).is_first_distinct()
+                ).to_series().to_numpy()
+            df = df[keep]
+            pdf = pdf.filter(pl.Series(keep))
             logger.info(f"Removed {initial_rows - len(df)} duplicate rows")
         
         # Handle columns with too many nulls
-        null_counts = df.isnull().sum() / len(df)
-        cols_to_drop = null_counts[null_counts > null_threshold].index.tolist()
+        null_counts = pd.Series(pdf.null_count().row(0), index=df.columns)
+        cols_to_drop = self._columns_to_drop(null_counts / len(df), null_threshold)
         
         if cols_to_drop:
             logger.warning(f"Dropping columns with >{null_threshold:.0%} nulls: {cols_to_drop}")
             df = df.drop(columns=cols_to_drop)
+            pdf = pdf.drop(cols_to_drop)
+            null_counts = null_counts.drop(cols_to_drop)
         
         # Handle remaining nulls
         if handle_nulls == 'drop':
-            df = df.dropna()
+            has_nulls = pdf.select(
+                pl.any_horizontal(pl.all().is_null())
+            ).to_series().to_numpy()
+            df = df[~has_nulls]
             logger.info(f"Dropped rows with nulls. Remaining: {len(df)}")
         elif handle_nulls == 'fill':
-            df = self._fill_nulls(df)
+            df = self._fill_nulls(df, null_counts)
         
         logger.info(f"Cleaning completed. Final rows: {len(df)}")
         return df
     
-    def _fill_nulls(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _columns_to_drop(
+        self,
+        null_fractions: pd.Series,
+        null_threshold: float
+    ) -> List[str]:
+        """
+        Pick columns whose share of nulls exceeds the threshold.
+        
+        With fit_once the first call's choice is reused, so every chunk
+        drops the same columns.
+        
+        Args:
+            null_fractions: Proportion of nulls per column
+            null_threshold: Max proportion of nulls allowed per column
+            
+        Returns:
+            Columns to drop
+        """
+        if self.fit_once and self._dropped_columns is not None:
+            return [col for col in self._dropped_columns if col in null_fractions.index]
+        
+        cols_to_drop = null_fractions[null_fractions > null_threshold].index.tolist()
+        if self.fit_once:
+            self._dropped_columns = cols_to_drop
+        
+        return cols_to_drop
+    
+    def _fill_nulls(
+        self,
+        df: pd.DataFrame,
+        null_counts: Optional[pd.Series] = None
+    ) -> pd.DataFrame:
         """
         Fill null values intelligently based on data type.
         
+        Fill values are computed per dtype group and applied with a
+        single fillna call. With fit_once they are computed once per
+        column, from the first chunk that has the column, and reused.
+        
         Args:
             df: Input DataFrame
+            null_counts: Precomputed nulls per column (computed if None)
             
         Returns:
             DataFrame with nulls filled
         """
-        for col in df.columns:
-            if df[col].isnull().any():
-                if df[col].dtype in ['int64', 'float64']:
-                    # Fill numeric with median
-                    df[col].fillna(df[col].median(), inplace=True)
-                elif df[col].dtype == 'object':
-                    # Fill categorical with mode or 'Unknown'
-                    mode_val = df[col].mode()
-                    fill_val = mode_val[0] if len(mode_val) > 0 else 'Unknown'
-                    df[col].fillna(fill_val, inplace=True)
-                elif df[col].dtype == 'datetime64[ns]':
-                    # Fill dates with median date
-                    df[col].fillna(df[col].median(), inplace=True)
+        if self.fit_once:
+            unfitted = [col for col in df.columns if col not in self._fill_values]
+            if unfitted:
+                fitted = self._compute_fill_values(df[unfitted])
+                # All-null columns have no statistic yet; retry next chunk
+                self._fill_values.update(
+                    {col: value for col, value in fitted.items() if pd.notna(value)}
+                )
+            
+            return df.fillna(
+                {col: value for col, value in self._fill_values.items() if col in df.columns}
+            )
         
-        return df
+        if null_counts is None:
+            null_counts = df.isnull().sum()
+        
+        nullable = df[null_counts[null_counts > 0].index]
+        if nullable.empty:
+            return df
+        
+        return df.fillna(self._compute_fill_values(nullable))
+    
+    @staticmethod
+    def _compute_fill_values(nullable: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Compute per-column fill values by dtype group.
+        
+        Args:
+            nullable: Columns to compute fill values for
+            
+        Returns:
+            Mapping of column to fill value
+        """
+        fill_values = {}
+        
+        # Fill numeric with median
+        numeric = nullable.select_dtypes(include=['number'])
+        fill_values.update(numeric.median().to_dict())
+        
+        # Fill categorical with mode or 'Unknown'
+        categorical = nullable.select_dtypes(include=['object'])
+        if not categorical.empty:
+            modes = categorical.mode()
+            if modes.empty:
+                modes = pd.Series(np.nan, index=categorical.columns)
+            else:
+                modes = modes.iloc[0]
+            fill_values.update(modes.fillna('Unknown').to_dict())
+        
+        # Fill dates with median date
+        dates = nullable.select_dtypes(include=['datetime64'])
+        fill_values.update(dates.median().to_dict())
+        
+        return fill_values
     
     def standardize_columns(
         self,
@@ -125,16 +354,13 @@ class DataTransformer:
             df = df.rename(columns=rename_map)
         
         # Standardize format
-        new_columns = []
-        for col in df.columns:
-            new_col = col
-            if to_lowercase:
-                new_col = new_col.lower()
-            if replace_spaces:
-                new_col = new_col.replace(' ', '_')
-            new_columns.append(new_col)
-        
-        df.columns = new_columns
+        columns = df.columns.astype(str)
+        if to_lowercase:
+            columns = columns.str.lower()
+        if replace_spaces:
+            columns = columns.str.replace(' ', '_', regex=False)
+        
+        df.columns = columns
         logger.info(f"Columns standardized: {df.columns.tolist()}")
         
         return df
@@ -147,6 +373,11 @@ class DataTransformer:
         """
         Convert column data types.
         
+        Integers and string categories use PyArrow-backed dtypes
+        (nullable int64 and dictionary-encoded strings) instead of
+        object arrays; categories of other values stay pandas
+        categoricals.
+        
         Args:
             df: Input DataFrame
             type_map: Dictionary mapping column names to target types
@@ -165,9 +396,13 @@ class DataTransformer:
                 if dtype == 'datetime':
                     df[col] = pd.to_datetime(df[col])
                 elif dtype == 'category':
-                    df[col] = df[col].astype('category')
+                    # Arrow dictionaries here hold strings only
+                    if pd.api.types.infer_dtype(df[col], skipna=True) in ('string', 'empty'):
+                        df[col] = df[col].astype(ARROW_CATEGORY)
+                    else:
+                        df[col] = df[col].astype('category')
                 elif dtype in ['int', 'int64']:
-                    df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
+                    df[col] = pd.to_numeric(df[col], errors='coerce').astype(ARROW_INT64)
                 elif dtype in ['float', 'float64']:
                     df[col] = pd.to_numeric(df[col], errors='coerce')
                 else:
@@ -3,11 +3,46 @@ Logging Utility Module
 Configures logging for the ETL pipeline.
 """
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional, Tuple
+
+# Parameters each logger was last configured with by setup_logger
+_CONFIGURED: Dict[str, Tuple] = {}
+
+# Shared by every handler setup_logger creates
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Rule framing the pipeline summary block
+_BANNER = "=" * 80
+
+# Background listeners writing each configured logger's records
+_LISTENERS: Dict[str, QueueListener] = {}
+
+
+def _stop_listener(name: str) -> None:
+    """Flush and stop a logger's listener, closing its handlers."""
+    listener = _LISTENERS.pop(name, None)
+    if listener is None:
+        return
+    
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    """Drain every queued record before the interpreter exits."""
+    for name in list(_LISTENERS):
+        _stop_listener(name)
 
 
 def setup_logger(
@@ -20,6 +55,11 @@ def setup_logger(
     """
     Setup logger with console and file handlers.
     
+    The logger only enqueues records; a QueueListener thread formats
+    them and performs the console/file writes and rotation. Calling
+    again with the same parameters returns the existing logger without
+    rebuilding its handlers.
+    
     Args:
         name: Logger name
         log_file: Path to log file (None for console only)
@@ -32,22 +72,22 @@ def setup_logger(
     """
     # Create logger
     logger = logging.getLogger(name)
+    
+    settings = (level, log_file, max_bytes, backup_count)
+    if _CONFIGURED.get(name) == settings and logger.handlers:
+        return logger
+    
     logger.setLevel(level)
     
     # Remove existing handlers
+    _stop_listener(name)
     logger.handlers = []
     
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(_FORMATTER)
+    handlers = [console_handler]
     
     # File handler (if log_file specified)
     if log_file:
@@ -61,8 +101,18 @@ def setup_logger(
             backupCount=backup_count
         )
         file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(_FORMATTER)
+        handlers.append(file_handler)
+    
+    # Writes happen on the listener thread, off the pipeline's hot path
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _LISTENERS[name] = listener
+    
+    _CONFIGURED[name] = settings
     
     return logger
 
@@ -74,6 +124,8 @@ class ETLLogger:
     Provides methods for logging ETL-specific events.
     """
     
+    __slots__ = ('logger',)
+    
     def __init__(self, logger: logging.Logger):
         """
         Initialize ETL Logger.
@@ -85,21 +137,23 @@ class ETLLogger:
     
     def log_extraction_start(self, source: str, params: dict = None):
         """Log start of extraction."""
-        msg = f"Starting extraction from {source}"
         if params:
-            msg += f" with params: {params}"
-        self.logger.info(msg)
+            self.logger.info(
+                "Starting extraction from %s with params: %s", source, params
+            )
+        else:
+            self.logger.info("Starting extraction from %s", source)
     
     def log_extraction_end(self, source: str, row_count: int, duration: float):
         """Log end of extraction."""
         self.logger.info(
-            f"Extraction from {source} completed: "
-            f"{row_count} rows in {duration:.2f}s"
+            "Extraction from %s completed: %d rows in %.2fs",
+            source, row_count, duration
         )
     
     def log_transformation_start(self, operation: str):
         """Log start of transformation."""
-        self.logger.info(f"Starting transformation: {operation}")
+        self.logger.info("Starting transformation: %s", operation)
     
     def log_transformation_end(
         self,
@@ -109,21 +163,19 @@ class ETLLogger:
     ):
         """Log end of transformation."""
         self.logger.info(
-            f"Transformation '{operation}' completed: "
-            f"{input_rows} -> {output_rows} rows"
+            "Transformation '%s' completed: %d -> %d rows",
+            operation, input_rows, output_rows
         )
     
     def log_load_start(self, target: str, row_count: int):
         """Log start of data load."""
-        self.logger.info(
-            f"Starting load to {target}: {row_count} rows"
-        )
+        self.logger.info("Starting load to %s: %d rows", target, row_count)
     
     def log_load_end(self, target: str, rows_loaded: int, duration: float):
         """Log end of data load."""
         self.logger.info(
-            f"Load to {target} completed: "
-            f"{rows_loaded} rows in {duration:.2f}s"
+            "Load to %s completed: %d rows in %.2fs",
+            target, rows_loaded, duration
         )
     
     def log_data_quality_check(self, check_name: str, passed: bool):
@@ -132,13 +184,13 @@ class ETLLogger:
         level = logging.INFO if passed else logging.WARNING
         self.logger.log(
             level,
-            f"Data Quality Check '{check_name}': {status}"
+            "Data Quality Check '%s': %s", check_name, status
         )
     
     def log_error(self, operation: str, error: Exception):
         """Log error with context."""
         self.logger.error(
-            f"Error in {operation}: {str(error)}",
+            "Error in %s: %s", operation, error,
             exc_info=True
         )
     
@@ -150,9 +202,12 @@ class ETLLogger:
     ):
         """Log pipeline execution summary."""
         status = "SUCCESS" if success else "FAILED"
-        self.logger.info("=" * 80)
-        self.logger.info("PIPELINE SUMMARY")
-        self.logger.info(f"Status: {status}")
-        self.logger.info(f"Rows Processed: {rows_processed}")
-        self.logger.info(f"Duration: {duration:.2f}s")
-        self.logger.info("=" * 80)
+        self.logger.info(
+            _BANNER + "\n"
+            "PIPELINE SUMMARY\n"
+            "Status: %s\n"
+            "Rows Processed: %d\n"
+            "Duration: %.2fs\n"
+            + _BANNER,
+            status, rows_processed, duration
+        )
@@ -13,69 +13,167 @@ from extract.csv_extractor import CSVExtractor
 from extract.api_extractor import APIExtractor
 
 
+@pytest.fixture(scope='module')
+def csv_extractor():
+    """Default CSV extractor shared by the module (it holds no state)."""
+    return CSVExtractor()
+
+
+@pytest.fixture(scope='module')
+def api_extractor():
+    """API extractor shared by the parsing tests."""
+    return APIExtractor("https://api.example.com")
+
+
+@pytest.fixture(scope='session')
+def sample_csv(tmp_path_factory):
+    """Three-row id/name/value CSV written once per session."""
+    test_file = tmp_path_factory.mktemp('data') / 'test.csv'
+    pd.DataFrame({
+        'id': [1, 2, 3],
+        'name': ['A', 'B', 'C'],
+        'value': [100, 200, 300]
+    }).to_csv(test_file, index=False)
+    return test_file
+
+
 class TestCSVExtractor:
     """Test CSV Extractor functionality."""
     
-    def test_extract_basic(self, tmp_path):
+    def test_extract_basic(self, csv_extractor, sample_csv):
         """Test basic CSV extraction."""
+        result = csv_extractor.extract(str(sample_csv))
+        
+        # Assert
+        assert len(result) == 3
+        assert list(result.columns) == ['id', 'name', 'value']
+        pd.testing.assert_series_equal(result['id'], pd.Series([1, 2, 3], name='id'))
+    
+    def test_extract_specific_columns(self, csv_extractor, sample_csv):
+        """Test extraction with column selection."""
+        result = csv_extractor.extract(str(sample_csv), columns=['id', 'name'])
+        
+        # Assert
+        assert list(result.columns) == ['id', 'name']
+        assert 'value' not in result.columns
+    
+    def test_extract_pyarrow_backend(self, sample_csv):
+        """Test extraction with the PyArrow parser backend."""
+        extractor = CSVExtractor(backend='pyarrow')
+        result = extractor.extract(str(sample_csv), dtypes={'value': 'float64'})
+        
+        # Assert
+        assert list(result.columns) == ['id', 'name', 'value']
+        pd.testing.assert_series_equal(
+            result['name'], pd.Series(['A', 'B', 'C'], name='name'), check_dtype=False
+        )
+        assert pd.api.types.is_float_dtype(result['value'])
+        
+    def test_extract_to_parquet_chunked(self, tmp_path):
+        """Test streaming CSV to Parquet in chunks."""
         # Create test CSV
         test_file = tmp_path / "test.csv"
         test_data = pd.DataFrame({
-            'id': [1, 2, 3],
-            'name': ['A', 'B', 'C'],
-            'value': [100, 200, 300]
+            'id': list(range(10)),
+            'value': [i * 10 for i in range(10)]
         })
         test_data.to_csv(test_file, index=False)
         
-        # Extract
-        extractor = CSVExtractor()
-        result = extractor.extract(str(test_file))
+        # Stream with chunks smaller than the file
+        output_file = tmp_path / "test.parquet"
+        extractor = CSVExtractor(chunk_size=3)
+        rows = extractor.extract_to_parquet(str(test_file), str(output_file))
         
         # Assert
+        result = pd.read_parquet(output_file)
+        assert rows == 10
+        pd.testing.assert_frame_equal(
+            result, test_data, check_dtype=False
+        )
+    
+    def test_extract_chunks(self, csv_extractor, tmp_path):
+        """Test streaming CSV extraction in chunks."""
+        # Create test CSV
+        test_file = tmp_path / "test.csv"
+        pd.DataFrame({'id': list(range(7))}).to_csv(test_file, index=False)
+        
+        chunks = list(csv_extractor.extract_chunks(str(test_file), chunk_size=3))
+        
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+        pd.testing.assert_series_equal(
+            pd.concat(chunks)['id'], pd.Series(range(7), name='id'), check_index=False
+        )
+    
+    def test_extract_multiple_pyarrow_dataset(self, tmp_path):
+        """Test multi-file extraction through an Arrow dataset."""
+        # Create test CSVs with different columns
+        sales_file = tmp_path / "sales.csv"
+        pd.DataFrame({'id': [1, 2], 'amount': [10.5, 20.0]}).to_csv(sales_file, index=False)
+        customers_file = tmp_path / "customers.csv"
+        pd.DataFrame({'id': [3], 'name': ['A']}).to_csv(customers_file, index=False)
+        
+        extractor = CSVExtractor(backend='pyarrow')
+        result = extractor.extract_multiple([str(sales_file), str(customers_file)])
+        
         assert len(result) == 3
-        assert list(result.columns) == ['id', 'name', 'value']
-        assert result['id'].tolist() == [1, 2, 3]
+        assert set(result.columns) == {'id', 'amount', 'name', 'source_file'}
+        pd.testing.assert_series_equal(
+            result['source_file'],
+            pd.Series(['sales.csv', 'sales.csv', 'customers.csv'], name='source_file'),
+            check_dtype=False,
+            check_categorical=False
+        )
+        assert result['name'].isna().sum() == 2
     
-    def test_extract_specific_columns(self, tmp_path):
-        """Test extraction with column selection."""
+    def test_extract_multiple_pyarrow_incompatible_files(self, tmp_path):
+        """Test fallback to per-file reads on type conflicts and bad files."""
+        numeric_file = tmp_path / "numeric.csv"
+        numeric_file.write_text("id,value\n1,10\n2,20\n")
+        text_file = tmp_path / "text.csv"
+        text_file.write_text("id,value\nx,abc\n")
+        bad_file = tmp_path / "bad.csv"
+        bad_file.write_text("id,value\n1,2,3,4\n")
+        
+        extractor = CSVExtractor(backend='pyarrow')
+        result = extractor.extract_multiple(
+            [str(numeric_file), str(text_file), str(bad_file)]
+        )
+        
+        assert len(result) == 3
+        assert result['source_file'].tolist() == ['numeric.csv', 'numeric.csv', 'text.csv']
+    
+    def test_get_file_info(self, csv_extractor, tmp_path):
+        """Test file info row counting."""
         # Create test CSV
         test_file = tmp_path / "test.csv"
         test_data = pd.DataFrame({
-            'id': [1, 2],
-            'name': ['A', 'B'],
-            'value': [100, 200]
+            'id': [1, 2, 3, 4],
+            'name': ['A', 'B', 'C', 'D']
         })
         test_data.to_csv(test_file, index=False)
         
-        # Extract specific columns
-        extractor = CSVExtractor()
-        result = extractor.extract(str(test_file), columns=['id', 'name'])
+        info = csv_extractor.get_file_info(str(test_file))
         
-        # Assert
-        assert list(result.columns) == ['id', 'name']
-        assert 'value' not in result.columns
+        assert info['row_count'] == 4
+        assert info['columns'] == ['id', 'name']
     
-    def test_extract_file_not_found(self):
+    def test_extract_file_not_found(self, csv_extractor):
         """Test handling of non-existent file."""
-        extractor = CSVExtractor()
-        
         with pytest.raises(FileNotFoundError):
-            extractor.extract('nonexistent.csv')
+            csv_extractor.extract('nonexistent.csv')
     
-    def test_validate_schema(self):
+    def test_validate_schema(self, csv_extractor):
         """Test schema validation."""
-        extractor = CSVExtractor()
-        
         df = pd.DataFrame({
             'id': [1, 2],
             'name': ['A', 'B']
         })
         
         # Valid schema
-        assert extractor.validate_schema(df, ['id', 'name']) == True
+        assert csv_extractor.validate_schema(df, ['id', 'name']) == True
         
         # Missing column
-        assert extractor.validate_schema(df, ['id', 'name', 'missing']) == False
+        assert csv_extractor.validate_schema(df, ['id', 'name', 'missing']) == False
 
 
 class TestAPIExtractor:
@@ -92,33 +190,23 @@ class TestAPIExtractor:
         assert extractor.api_key == "test_key"
         assert extractor.max_retries == 3
     
-    def test_parse_response_list(self):
+    def test_parse_response_list(self, api_extractor):
         """Test parsing list response."""
-        from unittest.mock import Mock
-        
-        extractor = APIExtractor("https://api.example.com")
-        
-        # Mock response with list
-        response = Mock()
-        response.json.return_value = [
+        # Decoded payload with list
+        payload = [
             {'id': 1, 'name': 'A'},
             {'id': 2, 'name': 'B'}
         ]
         
-        result = extractor._parse_response(response)
+        result = api_extractor._parse_response(payload)
         
         assert len(result) == 2
         assert result[0]['id'] == 1
     
-    def test_parse_response_dict_with_data(self):
+    def test_parse_response_dict_with_data(self, api_extractor):
         """Test parsing dict response with 'data' key."""
-        from unittest.mock import Mock
-        
-        extractor = APIExtractor("https://api.example.com")
-        
-        # Mock response with dict containing 'data'
-        response = Mock()
-        response.json.return_value = {
+        # Decoded payload with dict containing 'data'
+        payload = {
             'data': [
                 {'id': 1, 'name': 'A'},
                 {'id': 2, 'name': 'B'}
@@ -126,10 +214,43 @@ class TestAPIExtractor:
             'meta': {'total': 2}
         }
         
-        result = extractor._parse_response(response)
+        result = api_extractor._parse_response(payload)
         
         assert len(result) == 2
         assert result[0]['id'] == 1
+    
+    def test_decode_response(self, api_extractor):
+        """Test decoding response body once with orjson."""
+        from unittest.mock import Mock
+        
+        # Mock response with raw JSON bytes
+        response = Mock()
+        response.content = b'{"results": [{"id": 1}], "page": 1, "total_pages": 2}'
+        
+        payload = api_extractor._decode_response(response)
+        
+        assert api_extractor._parse_response(payload) == [{'id': 1}]
+        assert api_extractor._has_next_page(payload) == True
+        assert api_extractor._get_next_page_params(payload, {'q': 'x'}) == {'q': 'x', 'page': 2}
+    
+    def test_pagination_after_single_page_call(self):
+        """Test that a single-page first call does not disable pagination."""
+        from unittest.mock import Mock
+        
+        extractor = APIExtractor("https://api.example.com")
+        
+        payloads = [
+            b'{"data": [{"id": 1}]}',
+            b'{"data": [{"id": 2}], "page": 1, "next": "p2"}',
+            b'{"data": [{"id": 3}], "page": 2, "next": null}',
+        ]
+        extractor._make_request = Mock(
+            side_effect=[Mock(content=payload) for payload in payloads]
+        )
+        
+        assert extractor.extract('items') == [{'id': 1}]
+        assert extractor.extract('items') == [{'id': 2}, {'id': 3}]
+        assert extractor._make_request.call_args.args[1] == {'page': 2}
 
 
 if __name__ == '__main__':
@@ -0,0 +1,58 @@
+"""
+Unit tests for the pipeline orchestration.
+"""
+
+import pytest
+import pandas as pd
+from unittest.mock import MagicMock
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from main import ETLPipeline
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """Pipeline on the default config whose load step is a mock."""
+    monkeypatch.chdir(tmp_path)
+    etl = ETLPipeline(str(tmp_path / 'pipeline.yaml'))
+    etl.load = MagicMock(side_effect=lambda df, strategy: len(df))
+    return etl
+
+
+def make_chunk(stream, **columns):
+    """Extracted chunk tagged with its stream like extract_iter does."""
+    chunk = pd.DataFrame(columns)
+    chunk.attrs['stream'] = stream
+    return chunk
+
+
+class TestETLPipeline:
+    """Test ETL Pipeline streaming."""
+    
+    def test_run_rejects_new_columns_from_other_source(self, pipeline):
+        """Test that an API chunk with extra columns fails instead of losing them."""
+        pipeline.extract_iter = MagicMock(return_value=iter([
+            make_chunk('sales.csv', id=[1, 2], amount=[10.0, 20.0], source='csv'),
+            make_chunk('api', id=[3], temperature=[21.5], source='api'),
+        ]))
+        
+        assert pipeline.run() is False
+        assert pipeline.load.call_count == 1
+    
+    def test_run_loads_chunks_missing_columns(self, pipeline):
+        """Test that a chunk with a subset of the table's columns is loaded."""
+        pipeline.extract_iter = MagicMock(return_value=iter([
+            make_chunk('sales.csv', id=[1, 2], amount=[10.0, 20.0], source='csv'),
+            make_chunk('api', id=[3], source='api'),
+        ]))
+        
+        assert pipeline.run() is True
+        assert pipeline.load.call_count == 2
+        assert 'amount' not in pipeline.load.call_args_list[1].args[0].columns
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
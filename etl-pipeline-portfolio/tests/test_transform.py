@@ -13,27 +13,68 @@ sys.path.append(str(Path(__file__).parent.parent / 'src'))
 from transform.transformer import DataTransformer
 
 
+@pytest.fixture(scope='module')
+def transformer():
+    """Default transformer shared by the module (no cross-call state)."""
+    return DataTransformer()
+
+
+@pytest.fixture(scope='session')
+def dup_df():
+    """Frame with one duplicated row; tests must not mutate it."""
+    return pd.DataFrame({
+        'id': [1, 2, 2, 3],
+        'value': [100, 200, 200, 300]
+    })
+
+
+@pytest.fixture(scope='session')
+def id_value_df():
+    """Three-row id/value frame; tests must not mutate it."""
+    return pd.DataFrame({
+        'id': [1, 2, 3],
+        'value': [100, 200, 300]
+    })
+
+
 class TestDataTransformer:
     """Test Data Transformer functionality."""
     
-    def test_clean_remove_duplicates(self):
+    def test_clean_remove_duplicates(self, transformer, dup_df):
         """Test duplicate removal."""
-        transformer = DataTransformer()
+        result = transformer.clean(dup_df, remove_duplicates=True, handle_nulls='keep')
         
-        df = pd.DataFrame({
-            'id': [1, 2, 2, 3],
-            'value': [100, 200, 200, 300]
-        })
+        assert len(result) == 3
+        pd.testing.assert_series_equal(result['id'], pd.Series([1, 2, 3], name='id'), check_index=False)
+    
+    @pytest.mark.parametrize('backend', ['pandas', 'polars'])
+    def test_clean_dedup_across_calls(self, backend):
+        """Test duplicate removal across streamed chunks."""
+        transformer = DataTransformer(dedup_across_calls=True)
         
-        result = transformer.clean(df, remove_duplicates=True, handle_nulls='keep')
+        first = pd.DataFrame({'id': [1, 2, 2], 'value': [100, 200, 200]})
+        second = pd.DataFrame({'id': [2, 3], 'value': [200, 300]})
         
-        assert len(result) == 3
-        assert result['id'].tolist() == [1, 2, 3]
+        result_first = transformer.clean(first, handle_nulls='keep', backend=backend)
+        result_second = transformer.clean(second, handle_nulls='keep', backend=backend)
+        
+        pd.testing.assert_series_equal(result_first['id'], pd.Series([1, 2], name='id'), check_index=False)
+        pd.testing.assert_series_equal(result_second['id'], pd.Series([3], name='id'), check_index=False)
     
-    def test_clean_drop_nulls(self):
-        """Test null dropping."""
-        transformer = DataTransformer()
+    @pytest.mark.parametrize('backend', ['pandas', 'polars'])
+    def test_clean_skips_dedup_for_deduplicated_source(self, transformer, backend):
+        """Test that frames tagged as deduplicated keep all rows."""
+        df = pd.DataFrame({'id': [1, 1], 'value': [100, 100]})
+        df.attrs['deduplicated'] = True
+        
+        result = transformer.clean(
+            df, remove_duplicates=True, handle_nulls='keep', backend=backend
+        )
         
+        assert len(result) == 2
+    
+    def test_clean_drop_nulls(self, transformer):
+        """Test null dropping."""
         df = pd.DataFrame({
             'id': [1, 2, None, 4],
             'value': [100, 200, 300, 400]
@@ -44,10 +85,58 @@ class TestDataTransformer:
         assert len(result) == 3
         assert result['id'].isna().sum() == 0
     
-    def test_standardize_columns(self):
-        """Test column standardization."""
-        transformer = DataTransformer()
+    def test_clean_fit_once_across_chunks(self):
+        """Test that streamed chunks reuse the first chunk's null handling."""
+        transformer = DataTransformer(fit_once=True)
+        
+        first = pd.DataFrame({
+            'amount': [1.0, None, 3.0],
+            'sparse': [None, None, 'x']
+        })
+        second = pd.DataFrame({
+            'amount': [None, 100.0, 200.0],
+            'sparse': ['a', 'b', 'c']
+        })
+        
+        result_first = transformer.clean(first, remove_duplicates=False, handle_nulls='fill')
+        result_second = transformer.clean(second, remove_duplicates=False, handle_nulls='fill')
         
+        pd.testing.assert_index_equal(result_second.columns, result_first.columns)
+        pd.testing.assert_series_equal(
+            result_second['amount'], pd.Series([2.0, 100.0, 200.0], name='amount')
+        )
+    
+    def test_clean_polars_backend(self, transformer):
+        """Test cleaning with the Polars backend matches pandas."""
+        df = pd.DataFrame({
+            'id': [1, 2, 2, 3, 4],
+            'value': [100.0, 200.0, 200.0, None, 400.0],
+            'mostly_null': [None, None, None, 'x', None]
+        })
+        
+        result = transformer.clean(df, handle_nulls='drop', backend='polars')
+        expected = transformer.clean(df, handle_nulls='drop')
+        
+        pd.testing.assert_frame_equal(result, expected)
+    
+    def test_clean_fill_nulls(self, transformer):
+        """Test null filling by dtype."""
+        df = pd.DataFrame({
+            'amount': [1.0, None, 3.0, 10.0],
+            'category': ['A', 'B', 'A', None],
+            'date': pd.to_datetime(['2024-01-01', None, '2024-01-03', '2024-01-05'])
+        })
+        
+        result = transformer.clean(df, remove_duplicates=False, handle_nulls='fill')
+        
+        assert result.isna().sum().sum() == 0
+        pd.testing.assert_series_equal(result['amount'], pd.Series([1.0, 3.0, 3.0, 10.0], name='amount'))
+        pd.testing.assert_series_equal(result['category'], pd.Series(['A', 'B', 'A', 'A'], name='category'))
+        assert result['date'][1] == pd.Timestamp('2024-01-03')
+        assert df['amount'].isna().sum() == 1
+    
+    def test_standardize_columns(self, transformer):
+        """Test column standardization."""
         df = pd.DataFrame({
             'Customer ID': [1, 2],
             'Full Name': ['John', 'Jane'],
@@ -61,12 +150,10 @@ class TestDataTransformer:
         )
         
         expected_columns = ['customer_id', 'full_name', 'email_address']
-        assert result.columns.tolist() == expected_columns
+        pd.testing.assert_index_equal(result.columns, pd.Index(expected_columns))
     
-    def test_convert_types(self):
+    def test_convert_types(self, transformer):
         """Test type conversion."""
-        transformer = DataTransformer()
-        
         df = pd.DataFrame({
             'date': ['2024-01-01', '2024-01-02'],
             'amount': ['100.50', '200.75'],
@@ -85,10 +172,39 @@ class TestDataTransformer:
         assert pd.api.types.is_float_dtype(result['amount'])
         assert pd.api.types.is_integer_dtype(result['count'])
     
-    def test_add_derived_columns(self):
-        """Test adding derived columns."""
-        transformer = DataTransformer()
+    def test_convert_types_arrow_backed(self, transformer):
+        """Test integer and category conversion to PyArrow dtypes."""
+        df = pd.DataFrame({
+            'count': ['10', 'n/a', '30'],
+            'region': ['north', 'south', 'north']
+        })
+        
+        result = transformer.convert_types(df, {'count': 'int', 'region': 'category'})
+        
+        assert isinstance(result['count'].dtype, pd.ArrowDtype)
+        pd.testing.assert_series_equal(
+            result['count'].isna(), pd.Series([False, True, False], name='count'),
+            check_dtype=False
+        )
+        assert isinstance(result['region'].dtype, pd.ArrowDtype)
+        pd.testing.assert_series_equal(
+            result['region'].astype(object),
+            pd.Series(['north', 'south', 'north'], name='region')
+        )
+    
+    def test_convert_types_non_string_category(self, transformer):
+        """Test that int and bool columns still convert to categories."""
+        df = pd.DataFrame({'code': [1, 2, 1], 'flag': [True, False, True]})
         
+        result = transformer.convert_types(df, {'code': 'category', 'flag': 'category'})
+        
+        assert isinstance(result['code'].dtype, pd.CategoricalDtype)
+        assert list(result['code'].cat.categories) == [1, 2]
+        assert isinstance(result['flag'].dtype, pd.CategoricalDtype)
+        assert result['flag'].tolist() == [True, False, True]
+    
+    def test_add_derived_columns(self, transformer):
+        """Test adding derived columns."""
         df = pd.DataFrame({
             'quantity': [10, 20],
             'price': [100.0, 200.0]
@@ -101,12 +217,10 @@ class TestDataTransformer:
         result = transformer.add_derived_columns(df, derivations)
         
         assert 'total' in result.columns
-        assert result['total'].tolist() == [1000.0, 4000.0]
+        pd.testing.assert_series_equal(result['total'], pd.Series([1000.0, 4000.0], name='total'))
     
-    def test_aggregate(self):
+    def test_aggregate(self, transformer):
         """Test data aggregation."""
-        transformer = DataTransformer()
-        
         df = pd.DataFrame({
             'category': ['A', 'A', 'B', 'B'],
             'value': [10, 20, 30, 40]
@@ -122,46 +236,32 @@ class TestDataTransformer:
         assert result[result['category'] == 'A']['value'].values[0] == 30
         assert result[result['category'] == 'B']['value'].values[0] == 70
     
-    def test_validate_data(self):
+    def test_validate_data(self, transformer, id_value_df):
         """Test data validation."""
-        transformer = DataTransformer()
-        
-        df = pd.DataFrame({
-            'id': [1, 2, 3],
-            'value': [100, 200, 300]
-        })
-        
         validations = {
             'has_id': lambda x: 'id' in x.columns,
             'positive_values': lambda x: (x['value'] > 0).all(),
             'no_nulls': lambda x: x.isna().sum().sum() == 0
         }
         
-        results = transformer.validate_data(df, validations)
+        results = transformer.validate_data(id_value_df, validations)
         
         assert results['has_id'] == True
         assert results['positive_values'] == True
         assert results['no_nulls'] == True
     
-    def test_enrich_with_lookup(self):
+    def test_enrich_with_lookup(self, transformer, id_value_df):
         """Test data enrichment with lookup."""
-        transformer = DataTransformer()
-        
-        df = pd.DataFrame({
-            'id': [1, 2, 3],
-            'value': [100, 200, 300]
-        })
-        
         lookup_df = pd.DataFrame({
             'id': [1, 2, 3],
             'name': ['A', 'B', 'C']
         })
         
-        result = transformer.enrich_with_lookup(df, lookup_df, on='id')
+        result = transformer.enrich_with_lookup(id_value_df, lookup_df, on='id')
         
         assert 'name' in result.columns
         assert len(result) == 3
-        assert result['name'].tolist() == ['A', 'B', 'C']
+        pd.testing.assert_series_equal(result['name'], pd.Series(['A', 'B', 'C'], name='name'))
 
 
 if __name__ == '__main__':